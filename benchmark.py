@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import item_tracker
+from item_tracker import GunathonEngine, StateStore
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+def synthetic_catalog(size, tier_width=5):
+    return [(f"Weapon {index}", index * tier_width, (index + 1) * tier_width) for index in range(size)]
+
+def synthetic_deltas(count, seed=1234):
+    generator = random.Random(seed)
+    deltas = []
+    for _ in range(count):
+        roll = generator.random()
+        if roll < 0.80:
+            deltas.append(1)
+        elif roll < 0.95:
+            deltas.append(-1)
+        else:
+            deltas.append(generator.choice([2, -2, 50, -50]))
+    return deltas
+
+def percentile(sorted_samples, fraction):
+    if not sorted_samples:
+        return 0.0
+    position = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[position]
+
+def measure(name, size, operation, repeat, setup=None):
+    if setup:
+        setup()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - started)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    samples.sort()
+    total = sum(samples)
+    return {
+        "name": name,
+        "size": size,
+        "ops_per_sec": repeat / total if total > 0 else float("inf"),
+        "p50_us": percentile(samples, 0.50) * 1e6,
+        "p95_us": percentile(samples, 0.95) * 1e6,
+        "p99_us": percentile(samples, 0.99) * 1e6,
+        "peak_kib": peak / 1024,
+    }
+
+def bench_engine(size, operations):
+    rows = synthetic_catalog(size)
+    engine = GunathonEngine(rows, 0)
+    deltas = iter(synthetic_deltas(operations * 2))
+    span = rows[-1][2]
+    generator = random.Random(size)
+
+    def adjust_kills():
+        engine.adjust_kills(next(deltas))
+
+    def update_active_weapon():
+        engine.set_kills(generator.randrange(span))
+        engine.update_active_weapon()
+
+    def get_active_weapon():
+        engine.active_weapon()
+
+    return [
+        measure("adjust_kills", size, adjust_kills, operations),
+        measure("update_active_weapon", size, update_active_weapon, operations),
+        measure("get_active_weapon", size, get_active_weapon, operations),
+    ]
+
+def bench_persistence(size, repeat, directory):
+    rows = synthetic_catalog(size)
+    engine = GunathonEngine(rows, size * 2)
+    workbook = os.path.join(directory, f"catalog-{size}.xlsx")
+    store = StateStore(os.path.join(directory, f"tracker-{size}.db"))
+
+    results = [
+        measure("save_items_to_excel", size, lambda: GunathonEngine.write_workbook(workbook, engine.snapshot()), repeat),
+        measure("read_workbook", size, lambda: GunathonEngine.read_workbook(workbook), repeat),
+        measure("store.replace_catalog", size, lambda: store.replace_catalog(engine.catalog.rows()), repeat),
+        measure("store.save_progress", size, lambda: store.save_progress(engine.kills, engine.active_weapon_index), repeat * 20),
+        measure("store.load", size, store.load, repeat),
+    ]
+    store.close()
+    return results
+
+def start_virtual_display():
+    if os.environ.get("DISPLAY") or sys.platform.startswith("win") or sys.platform == "darwin":
+        return None
+    if not shutil.which("Xvfb"):
+        return None
+    display = ":97"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x720x24"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return process
+
+def bench_update_ui(size, operations, directory):
+    try:
+        root = item_tracker.tk.Tk()
+    except item_tracker.tk.TclError as e:
+        print(f"Skipping update_ui for {size} weapons: no display ({e})", file=sys.stderr)
+        return []
+
+    working_directory = os.getcwd()
+    ui_directory = os.path.join(directory, f"ui-{size}")
+    os.makedirs(ui_directory)
+    os.chdir(ui_directory)
+    # Seed the store so the tracker starts without creating items.xlsx or showing dialogs,
+    # and keep the benchmark from installing global keyboard hooks.
+    store = StateStore("tracker.db")
+    store.replace_catalog(synthetic_catalog(size))
+    store.save_progress(0, 0)
+    store.close()
+    keyboard = item_tracker.keyboard
+    item_tracker.keyboard = None
+    try:
+        try:
+            app = item_tracker.HuntShowdownGunathonTracker(root)
+        except item_tracker.tk.TclError as e:
+            print(f"Skipping update_ui for {size} weapons: tracker could not start ({e})", file=sys.stderr)
+            root.destroy()
+            return []
+        # Drive the engine directly and redraw synchronously instead of through the journal and render scheduler.
+        app.engine.unsubscribe(app.on_engine_event)
+        deltas = iter(synthetic_deltas(operations * 2))
+
+        def update_ui():
+            changes = app.engine.set_kills(app.current_kills + next(deltas))
+            app.update_ui(changes)
+            root.update_idletasks()
+
+        result = measure("update_ui", size, update_ui, operations)
+        app.file_watcher.stop()
+        app.autosave.stop()
+        app.journal.close()
+        app.store.close()
+        root.destroy()
+        return [result]
+    finally:
+        item_tracker.keyboard = keyboard
+        os.chdir(working_directory)
+
+def compare(results, baseline, threshold):
+    previous = {(entry["name"], entry["size"]): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for entry in results:
+        old = previous.get((entry["name"], entry["size"]))
+        if old and entry["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold):
+            regressions.append((entry, old))
+    return regressions
+
+def print_results(results):
+    print(f"{'benchmark':<24}{'weapons':>9}{'ops/sec':>14}{'p50 us':>11}{'p95 us':>11}{'p99 us':>11}{'peak KiB':>11}")
+    for entry in results:
+        print(
+            f"{entry['name']:<24}{entry['size']:>9}{entry['ops_per_sec']:>14.0f}"
+            f"{entry['p50_us']:>11.1f}{entry['p95_us']:>11.1f}{entry['p99_us']:>11.1f}{entry['peak_kib']:>11.1f}"
+        )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the tracker's hot paths on synthetic catalogs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="catalog sizes to generate")
+    parser.add_argument("--operations", type=int, default=2000, help="kill changes / lookups per size")
+    parser.add_argument("--io-repeat", type=int, default=3, help="repetitions of each Excel and store operation")
+    parser.add_argument("--max-io-size", type=int, default=10000, help="largest catalog used for Excel benchmarks")
+    parser.add_argument("--skip-ui", action="store_true", help="do not benchmark update_ui")
+    parser.add_argument("--baseline", default="benchmark_baseline.json", help="baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed ops/sec drop before reporting a regression")
+    args = parser.parse_args(argv)
+
+    display = None if args.skip_ui else start_virtual_display()
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for size in args.sizes:
+                results.extend(bench_engine(size, args.operations))
+                if size <= args.max_io_size:
+                    results.extend(bench_persistence(size, args.io_repeat, directory))
+                if not args.skip_ui:
+                    results.extend(bench_update_ui(size, min(args.operations, 500), directory))
+    finally:
+        if display:
+            display.terminate()
+
+    print_results(results)
+
+    status = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        for entry, old in regressions:
+            print(
+                f"REGRESSION {entry['name']} ({entry['size']} weapons): "
+                f"{entry['ops_per_sec']:.0f} ops/sec vs {old['ops_per_sec']:.0f} in baseline",
+                file=sys.stderr,
+            )
+        status = 1 if regressions else 0
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump({"python": sys.version.split()[0], "platform": sys.platform, "results": results}, baseline_file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
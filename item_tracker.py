@@ -1,24 +1,1791 @@
 import tkinter as tk
 from tkinter import messagebox, colorchooser, font as tkFont, ttk, filedialog
-from openpyxl import Workbook, load_workbook
+import argparse
 import configparser
+import contextlib
+import csv
+import hashlib
+import io
+import json
+import multiprocessing
 import os
-import keyboard  # For global keybinds
+import queue
+import sqlite3
+import stat
+import string
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import shared_memory
+try:
+    import keyboard  # For global keybinds
+except ImportError:
+    keyboard = None
+
+class WeaponRangeIndex:
+    def __init__(self, starts=(), ends=()):
+        self.rebuild(starts, ends)
+
+    def rebuild(self, starts, ends):
+        # Positions into the catalog, ordered by range so lookups can bisect.
+        self.order = sorted(range(len(starts)), key=lambda i: (starts[i], ends[i]))
+        self.starts = [starts[i] for i in self.order]
+        self.ends = [ends[i] for i in self.order]
+        self.positions = [0] * len(starts)
+        for position, item_index in enumerate(self.order):
+            self.positions[item_index] = position
+        # Kills needed to clear every tier before each position, so progress queries need one bisect.
+        # Progress counts from zero kills; the first tier usually starts far below it.
+        self.spans_before = [0]
+        for range_start, range_end in zip(self.starts, self.ends):
+            self.spans_before.append(self.spans_before[-1] + max(range_end - max(range_start, 0), 0))
+        self.last_end = max(self.ends, default=0)
+
+    def __len__(self):
+        return len(self.order)
+
+    def locate(self, kills):
+        return bisect_right(self.starts, kills) - 1
+
+    def active_position(self, kills):
+        position = self.locate(kills)
+        if position >= 0 and kills < self.ends[position]:
+            return position
+        return None
+
+    def active_index(self, kills):
+        position = self.active_position(kills)
+        return self.order[position] if position is not None else None
+
+    def progress(self, kills):
+        located = self.locate(kills)
+        active = located >= 0 and kills < self.ends[located]
+        completed = located if active else located + 1
+        done = self.spans_before[completed] + (max(kills - max(self.starts[located], 0), 0) if active else 0)
+        total = self.spans_before[-1]
+        next_position = completed + 1 if active else completed
+        return {
+            "remaining": self.ends[located] - kills if active else 0,
+            "tiers_left": len(self.order) - completed,
+            "percent": round(100.0 * done / total, 1) if total else 100.0,
+            "to_finish": max(self.last_end - kills, 0),
+            "next_index": self.order[next_position] if next_position < len(self.order) else None,
+        }
+
+    def status_at(self, position, kills):
+        located = self.locate(kills)
+        if position < located or (position == located and kills >= self.ends[position]):
+            return WeaponCatalog.COMPLETE
+        if position == located:
+            return WeaponCatalog.ACTIVE
+        return WeaponCatalog.INCOMPLETE
+
+    def status(self, item_index, kills):
+        return self.status_at(self.positions[item_index], kills)
+
+    def diff(self, old_kills, new_kills):
+        delta = ProgressionDelta(old_kills, new_kills)
+        if not self.order or old_kills == new_kills:
+            return delta
+        old_located = self.locate(old_kills)
+        new_located = self.locate(new_kills)
+        # Only positions between the two located tiers can change status.
+        first = max(min(old_located, new_located), 0)
+        last = min(max(old_located, new_located), len(self.order) - 1)
+        for position in range(first, last + 1):
+            old_status = self.status_at(position, old_kills)
+            new_status = self.status_at(position, new_kills)
+            if old_status != new_status:
+                delta.record(self.order[position], new_status)
+        return delta
+
+class ProgressionDelta:
+    def __init__(self, old_kills=None, new_kills=None):
+        self.old_kills = old_kills
+        self.new_kills = new_kills
+        self.completed = []
+        self.activated = []
+        self.reverted = []
+
+    def __bool__(self):
+        return bool(self.completed or self.activated or self.reverted)
+
+    def record(self, item_index, status):
+        if status == WeaponCatalog.COMPLETE:
+            self.completed.append(item_index)
+        elif status == WeaponCatalog.ACTIVE:
+            self.activated.append(item_index)
+        else:
+            self.reverted.append(item_index)
+
+    @property
+    def changed(self):
+        return set(self.completed) | set(self.activated) | set(self.reverted)
+
+    def merge(self, other):
+        if self.old_kills is None:
+            self.old_kills = other.old_kills
+        self.new_kills = other.new_kills
+        self.completed.extend(other.completed)
+        self.activated.extend(other.activated)
+        self.reverted.extend(other.reverted)
+
+class WeaponView:
+    __slots__ = ("catalog", "index")
+
+    def __init__(self, catalog, index):
+        self.catalog = catalog
+        self.index = index
+
+    @property
+    def weapon(self):
+        return self.catalog.names[self.index]
+
+    @property
+    def range_start(self):
+        return self.catalog.starts[self.index]
+
+    @property
+    def range_end(self):
+        return self.catalog.ends[self.index]
+
+    @property
+    def status(self):
+        return self.catalog.status_name(self.index)
+
+class WeaponCatalog:
+    INCOMPLETE = 0
+    ACTIVE = 1
+    COMPLETE = 2
+    STATUS_NAMES = ("Incomplete", "Active", "Complete")
+
+    def __init__(self, rows=(), kills=0):
+        self.index = WeaponRangeIndex()
+        self.replace(rows, kills)
+
+    def replace(self, rows, kills=None):
+        self.names = []
+        self.starts = array("q")
+        self.ends = array("q")
+        for name, range_start, range_end in rows:
+            self.names.append(sys.intern(str(name)))
+            self.starts.append(range_start)
+            self.ends.append(range_end)
+        if kills is not None:
+            self.kills = kills
+        self.reindex()
+
+    def append(self, name, range_start, range_end):
+        return self.insert(len(self.names), name, range_start, range_end)
+
+    def insert(self, item_index, name, range_start, range_end):
+        self.names.insert(item_index, sys.intern(str(name)))
+        self.starts.insert(item_index, range_start)
+        self.ends.insert(item_index, range_end)
+        self.reindex()
+        return item_index
+
+    def remove(self, item_index):
+        del self.names[item_index]
+        del self.starts[item_index]
+        del self.ends[item_index]
+        self.reindex()
+
+    @staticmethod
+    def row_keys(rows):
+        # (name, occurrence) for each row, so weapons that share a name are still told apart.
+        seen = {}
+        keyed = {}
+        for name, range_start, range_end in rows:
+            occurrence = seen.get(name, 0)
+            seen[name] = occurrence + 1
+            keyed[(name, occurrence)] = (range_start, range_end)
+        return keyed
+
+    def merge_rows(self, base, rows):
+        # Three-way merge keyed by weapon name and occurrence: only rows that differ from base are applied,
+        # so weapons added, imported or repaired here survive an edit elsewhere in the file.
+        # Returns the names that were changed, added or removed.
+        base = self.row_keys(base)
+        edited = self.row_keys(rows)
+        removed = base.keys() - edited.keys()
+        updated = {key: span for key, span in edited.items() if base.get(key) != span}
+        keys = list(self.row_keys(self.rows()))
+        changed = []
+        for item_index in reversed(range(len(self.names))):
+            key = keys[item_index]
+            if key in removed:
+                del self.names[item_index]
+                del self.starts[item_index]
+                del self.ends[item_index]
+                changed.append(key[0])
+            elif key in updated:
+                self.starts[item_index], self.ends[item_index] = updated.pop(key)
+                changed.append(key[0])
+        if changed:
+            self.reindex()
+        for (name, _), (range_start, range_end) in updated.items():
+            self.insert(self.insertion_index(range_start), name, range_start, range_end)
+            changed.append(name)
+        return changed
+
+    def shift(self, from_start, amount):
+        for item_index in range(len(self.names)):
+            if self.starts[item_index] >= from_start:
+                self.starts[item_index] += amount
+                self.ends[item_index] += amount
+        self.reindex()
+
+    def insertion_index(self, range_start):
+        # Catalog position that keeps a range-sorted catalog sorted.
+        position = bisect_left(self.index.starts, range_start)
+        return self.index.order[position] if position < len(self.index) else len(self.names)
+
+    def neighbours(self, range_start):
+        # The ranges just before and at or after range_start in sorted order, as (start, end) or None.
+        position = bisect_left(self.index.starts, range_start)
+        before = (self.index.starts[position - 1], self.index.ends[position - 1]) if position > 0 else None
+        after = (self.index.starts[position], self.index.ends[position]) if position < len(self.index) else None
+        return before, after
+
+    def reindex(self):
+        self.index.rebuild(self.starts, self.ends)
+        self.statuses = bytearray(len(self.names))
+        for item_index in range(len(self.names)):
+            self.statuses[item_index] = self.index.status(item_index, self.kills)
+
+    def set_kills(self, kills):
+        delta = self.index.diff(self.kills, kills)
+        self.kills = kills
+        for item_index in delta.completed:
+            self.statuses[item_index] = self.COMPLETE
+        for item_index in delta.activated:
+            self.statuses[item_index] = self.ACTIVE
+        for item_index in delta.reverted:
+            self.statuses[item_index] = self.INCOMPLETE
+        return delta
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, item_index):
+        if not 0 <= item_index < len(self.names):
+            raise IndexError(item_index)
+        return WeaponView(self, item_index)
+
+    def __iter__(self):
+        return (WeaponView(self, item_index) for item_index in range(len(self.names)))
+
+    def status_name(self, item_index):
+        return self.STATUS_NAMES[self.statuses[item_index]]
+
+    def active_index(self):
+        return self.index.active_index(self.kills)
+
+    def progress(self):
+        progress = self.index.progress(self.kills)
+        next_index = progress.pop("next_index")
+        progress["next_weapon"] = self.names[next_index] if next_index is not None else "None"
+        return progress
+
+    def rows(self):
+        return tuple(zip(self.names, self.starts, self.ends))
+
+class EditHistory:
+    def __init__(self, limit=200):
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = deque(maxlen=limit)
+        self.recording = True
+
+    def record(self, *entry):
+        # Entries are small reversible records: ("kills", old, new) or ("weapon", index, name, start, end, shift).
+        if self.recording:
+            self.undo_stack.append(entry)
+            self.redo_stack.clear()
+
+    def set_limit(self, limit):
+        self.undo_stack = deque(self.undo_stack, maxlen=limit)
+        self.redo_stack = deque(self.redo_stack, maxlen=limit)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+class RenderScheduler:
+    def __init__(self, root, callback, max_refresh_rate=30):
+        self.root = root
+        self.callback = callback
+        self.max_refresh_rate = max_refresh_rate
+        self.after_id = None
+        self.last_flush = 0.0
+        self.full_refresh = False
+        self.changes = None
+
+    def request(self, changes=None):
+        if changes is None:
+            self.full_refresh = True
+        else:
+            if self.changes is None:
+                self.changes = ProgressionDelta()
+            self.changes.merge(changes)
+
+        if self.after_id is not None:
+            return
+        min_interval = 1.0 / self.max_refresh_rate if self.max_refresh_rate > 0 else 0.0
+        delay = self.last_flush + min_interval - time.perf_counter()
+        if delay > 0:
+            self.after_id = self.root.after(int(delay * 1000) + 1, self.flush)
+        else:
+            self.after_id = self.root.after_idle(self.flush)
+
+    def flush(self):
+        self.after_id = None
+        changes = None if self.full_refresh else self.changes
+        self.full_refresh = False
+        self.changes = None
+        self.last_flush = time.perf_counter()
+        self.callback(changes)
+
+class FontCache:
+    def __init__(self):
+        self.fonts = {}
+        self.shared_font = None
+        self.shared_key = None
+
+    @staticmethod
+    def font_options(key):
+        family, size, bold, italic, underline = key
+        return {
+            "family": family,
+            "size": size,
+            "weight": "bold" if bold else "normal",
+            "slant": "italic" if italic else "roman",
+            "underline": underline,
+        }
+
+    def get(self, family, size, bold=False, italic=False, underline=False):
+        key = (family, size, bool(bold), bool(italic), bool(underline))
+        font = self.fonts.get(key)
+        if font is None:
+            font = tkFont.Font(**self.font_options(key))
+            self.fonts[key] = font
+        return font
+
+    def shared(self, family, size, bold=False, italic=False, underline=False):
+        # One named font reused by every overlay label; Tk repaints its users when it is reconfigured.
+        key = (family, size, bool(bold), bool(italic), bool(underline))
+        if self.shared_font is None:
+            self.shared_font = tkFont.Font(**self.font_options(key))
+        elif key != self.shared_key:
+            self.shared_font.configure(**self.font_options(key))
+        self.shared_key = key
+        return self.shared_font
+
+class FontFamilyCatalog:
+    def __init__(self, filename):
+        self.filename = filename
+        self.families = None
+        self.folded = {}
+
+    @staticmethod
+    def font_directories():
+        home = os.path.expanduser("~")
+        if sys.platform.startswith("win"):
+            return [
+                os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts"),
+            ]
+        if sys.platform == "darwin":
+            return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+        return ["/usr/share/fonts", "/usr/local/share/fonts", os.path.join(home, ".local", "share", "fonts"), os.path.join(home, ".fonts")]
+
+    def fingerprint(self):
+        # Installing or removing a font touches its directory, which invalidates the cached list.
+        directories = []
+        for directory in self.font_directories():
+            with contextlib.suppress(OSError):
+                directories.append([directory, os.stat(directory).st_mtime_ns])
+        return {"tk": tk.TkVersion, "directories": directories}
+
+    def load(self, root, autosave):
+        if self.families is not None:
+            return self.families
+
+        fingerprint = self.fingerprint()
+        with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+            with open(self.filename) as cache_file:
+                cached = json.load(cache_file)
+            if cached["fingerprint"] == fingerprint:
+                self.set_families(cached["families"])
+                return self.families
+
+        families = sorted(set(tkFont.families(root)), key=str.casefold)
+        self.set_families(families)
+        text = json.dumps({"fingerprint": fingerprint, "families": families})
+
+        def write(path):
+            with open(path, "w") as cache_file:
+                cache_file.write(text)
+
+        autosave.submit(self.filename, write, key="font_families")
+        return self.families
+
+    def set_families(self, families):
+        self.families = families
+        self.folded = {family: family.casefold() for family in families}
+
+    def search(self, query, candidates=None):
+        # Matches for a longer query are always a subset of the matches for its prefix,
+        # so callers pass the previous result to narrow it instead of rescanning everything.
+        query = query.casefold()
+        if not query:
+            return self.families
+        folded = self.folded
+        prefix = []
+        contains = []
+        for family in candidates if candidates is not None else self.families:
+            position = folded[family].find(query)
+            if position == 0:
+                prefix.append(family)
+            elif position > 0:
+                contains.append(family)
+        return prefix + contains
+
+class HotkeyEventQueue:
+    def __init__(self):
+        self.events = queue.SimpleQueue()
+
+    def push(self, kind, value=0):
+        # Called from the keyboard listener thread, so it must not touch Tk.
+        self.events.put((kind, value, time.perf_counter()))
+
+    def drain(self):
+        batch = []
+        while True:
+            try:
+                kind, value, received = self.events.get_nowait()
+            except queue.Empty:
+                return batch
+            if kind == "kills" and batch and batch[-1][0] == "kills":
+                batch[-1] = ("kills", batch[-1][1] + value, batch[-1][2])
+            elif kind == "ingest" and batch and batch[-1][0] == "ingest":
+                delta, advance = batch[-1][1]
+                batch[-1] = ("ingest", (delta + value[0], advance + value[1]), batch[-1][2])
+            else:
+                batch.append((kind, value, received))
+
+class KillEventTail:
+    CHUNK_SIZE = 65536
+
+    def __init__(self, path, events, identity=None, offset=0, poll_interval=0.05):
+        self.path = path
+        self.events = events
+        self.identity = identity
+        self.offset = offset
+        self.poll_interval = poll_interval
+        self.skipped = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="kill-event-tail", daemon=True)
+
+    @staticmethod
+    def file_identity(info):
+        # Fits a journal record's 64-bit value field on every platform.
+        digest = hashlib.blake2b(f"{info.st_dev}:{info.st_ino}".encode(), digest_size=7).digest()
+        return int.from_bytes(digest, "little")
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join(timeout=1.0)
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                self.follow()
+            except OSError:
+                # The source is missing or unreadable; keep waiting for it to appear.
+                self.stopped.wait(self.poll_interval * 10)
+
+    def follow(self):
+        info = os.stat(self.path)
+        identity = self.file_identity(info)
+        fifo = stat.S_ISFIFO(info.st_mode)
+        if identity != self.identity or fifo or info.st_size < self.offset:
+            # A new, rotated or truncated file is read from the start.
+            self.identity = identity
+            self.offset = 0
+            self.events.push("ingest_file", identity)
+
+        fd = os.open(self.path, os.O_RDONLY | (getattr(os, "O_NONBLOCK", 0) if fifo else 0))
+        try:
+            if self.offset:
+                os.lseek(fd, self.offset, os.SEEK_SET)
+            pending = b""
+            while not self.stopped.is_set():
+                try:
+                    chunk = os.read(fd, self.CHUNK_SIZE)
+                except BlockingIOError:
+                    chunk = b""
+                if chunk:
+                    pending = self.consume(pending + chunk)
+                    continue
+                if not fifo and self.replaced():
+                    return
+                self.stopped.wait(self.poll_interval)
+        finally:
+            os.close(fd)
+
+    def replaced(self):
+        try:
+            info = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return self.file_identity(info) != self.identity or info.st_size < self.offset
+
+    def consume(self, data):
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return data
+        delta = 0
+        for line in data[:end].decode("utf-8", "replace").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                delta += int(line)
+            except ValueError:
+                self.skipped += 1
+        self.offset += end
+        self.events.push("ingest", (delta, end))
+        return data[end:]
+
+class FileWatcher:
+    def __init__(self, events, interval=1.0):
+        self.events = events
+        self.interval = interval
+        self.watched = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="file-watcher", daemon=True)
+
+    @staticmethod
+    def fingerprint(path):
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def watch(self, path, loader, report_existing=False):
+        # report_existing loads the file once on the first poll, even if it never changes.
+        fingerprint = None if report_existing else self.fingerprint(path)
+        with self.lock:
+            self.watched[path] = {"fingerprint": fingerprint, "pending": None, "loader": loader}
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join(timeout=1.0)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            with self.lock:
+                watched = list(self.watched.items())
+            for path, entry in watched:
+                current = self.fingerprint(path)
+                if current is None or current == entry["fingerprint"]:
+                    continue
+                if current != entry["pending"]:
+                    # Wait until the file stops changing so a save in progress is not read half-written.
+                    entry["pending"] = current
+                    continue
+                entry["fingerprint"] = current
+                entry["pending"] = None
+                # Parsing happens here, off the Tk thread; only the result is queued.
+                try:
+                    result = entry["loader"](path)
+                except Exception as e:
+                    result = e
+                self.events.push("file_changed", (path, result))
+
+class MetricTimer:
+    def __init__(self, monitor, metric):
+        self.monitor = monitor
+        self.metric = metric
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.monitor.record(self.metric, time.perf_counter() - self.started)
+        return False
+
+class PerfMonitor:
+    NULL_TIMER = contextlib.nullcontext()
+
+    def __init__(self, enabled=False, history=5000):
+        self.enabled = enabled
+        # Rolling trace of (wall time, metric, milliseconds or count); deque appends are safe from the autosave thread.
+        self.samples = deque(maxlen=history)
+        self.refresh_times = deque(maxlen=1000)
+        self.input_started = None
+        self.state_recorded = False
+
+    def measure(self, metric):
+        return MetricTimer(self, metric) if self.enabled else self.NULL_TIMER
+
+    def record(self, metric, seconds):
+        if self.enabled:
+            self.samples.append((time.time(), metric, seconds * 1000))
+
+    def input_received(self, received=None):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if received is not None:
+            self.record("hotkey_queue_wait", now - received)
+        if self.input_started is None:
+            self.input_started = received if received is not None else now
+            self.state_recorded = False
+
+    def state_updated(self):
+        if self.enabled and self.input_started is not None and not self.state_recorded:
+            self.record("input_to_state", time.perf_counter() - self.input_started)
+            self.state_recorded = True
+
+    def painted(self, started):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record("update_ui", now - started)
+        self.refresh_times.append(now)
+        if self.input_started is not None:
+            self.record("input_to_paint", now - self.input_started)
+            self.input_started = None
+
+    def refreshes_per_second(self):
+        cutoff = time.perf_counter() - 1.0
+        return sum(1 for refreshed in self.refresh_times if refreshed >= cutoff)
+
+    def summary(self):
+        values = {}
+        for timestamp, metric, milliseconds in list(self.samples):
+            values.setdefault(metric, []).append(milliseconds)
+        rows = []
+        for metric in sorted(values):
+            ordered = sorted(values[metric])
+            rows.append((
+                metric,
+                len(ordered),
+                values[metric][-1],
+                ordered[len(ordered) // 2],
+                ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            ))
+        return rows
+
+    def export(self, filename):
+        samples = list(self.samples)
+        if filename.lower().endswith(".json"):
+            with open(filename, "w") as trace_file:
+                json.dump([{"time": t, "metric": m, "value": value} for t, m, value in samples], trace_file, indent=1)
+        else:
+            with open(filename, "w", newline="") as trace_file:
+                writer = csv.writer(trace_file)
+                writer.writerow(["time", "metric", "value"])
+                writer.writerows(samples)
+
+class KillJournal:
+    KILLS = 1
+    ACTIVE_WEAPON = 2
+    # Kills from the event source: delta is the absolute kills, value the absolute source offset,
+    # so replaying a record that already reached the state store changes nothing.
+    INGEST = 3
+    INGEST_FILE = 4
+    # Both fields are int64, the width of the catalog's range arrays, so any kill count fits.
+    RECORD = struct.Struct("<Bxxxxxxxqq")
+    MAX_VALUE = 2 ** 63 - 1
+    CHECKSUM = struct.Struct("<I")
+    RECORD_SIZE = RECORD.size + CHECKSUM.size
+
+    def __init__(self, filename, compact_every=500):
+        self.filename = filename
+        self.compact_every = compact_every
+        self.file = None
+        self.record_count = 0
+        self.needs_sync = False
+        self.next_generation = 1
+
+    def segments(self):
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        prefix = os.path.basename(self.filename) + "."
+        segments = []
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name[len(prefix):].isdigit():
+                segments.append((int(name[len(prefix):]), os.path.join(directory, name)))
+        return sorted(segments)
+
+    def read_records(self, filename):
+        with open(filename, "rb") as journal_file:
+            data = journal_file.read()
+
+        records = []
+        valid_length = 0
+        while valid_length + self.RECORD_SIZE <= len(data):
+            payload = data[valid_length:valid_length + self.RECORD.size]
+            checksum = self.CHECKSUM.unpack_from(data, valid_length + self.RECORD.size)[0]
+            if zlib.crc32(payload) != checksum:
+                break
+            records.append(self.RECORD.unpack(payload))
+            valid_length += self.RECORD_SIZE
+        return records, valid_length
+
+    def replay(self):
+        # Segments are journals rotated out by a snapshot that has not finished writing yet.
+        records = []
+        for generation, segment in self.segments():
+            records.extend(self.read_records(segment)[0])
+            self.next_generation = generation + 1
+
+        valid_length = 0
+        if os.path.exists(self.filename):
+            current_records, valid_length = self.read_records(self.filename)
+            records.extend(current_records)
+            self.record_count = len(current_records)
+
+        # Drop a torn trailing record so new appends stay aligned.
+        self.file = open(self.filename, "ab")
+        self.file.truncate(valid_length)
+        return records
+
+    def append(self, kind, delta, value):
+        payload = self.RECORD.pack(kind, delta, value)
+        self.file.write(payload + self.CHECKSUM.pack(zlib.crc32(payload)))
+        self.file.flush()
+        self.record_count += 1
+        self.needs_sync = True
+
+    def sync(self):
+        if self.needs_sync:
+            getattr(os, "fdatasync", os.fsync)(self.file.fileno())
+            self.needs_sync = False
+
+    def should_compact(self):
+        return self.record_count >= self.compact_every
+
+    def reset(self):
+        self.file.truncate(0)
+        os.fsync(self.file.fileno())
+        self.record_count = 0
+        self.needs_sync = False
+
+    def rotate(self):
+        generation = self.next_generation
+        self.next_generation += 1
+        self.sync()
+        self.file.close()
+        if os.path.getsize(self.filename) > 0:
+            os.replace(self.filename, f"{self.filename}.{generation}")
+        self.file = open(self.filename, "ab")
+        self.record_count = 0
+        return generation
+
+    def discard_segments(self, generation):
+        # Runs on the autosave thread once the snapshot covering these segments is on disk.
+        for segment_generation, segment in self.segments():
+            if segment_generation <= generation:
+                try:
+                    os.remove(segment)
+                except OSError:
+                    pass
+
+    def close(self):
+        if self.file:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+class AutosaveWorker:
+    def __init__(self, debounce=1.0, perf=None):
+        self.debounce = debounce
+        self.perf = perf or PerfMonitor()
+        self.pending = {}
+        self.errors = queue.SimpleQueue()
+        self.condition = threading.Condition()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="autosave", daemon=True)
+        self.thread.start()
+
+    def submit(self, filename, write, on_saved=None, atomic=True, key=None):
+        key = key or filename
+        with self.condition:
+            # A newer snapshot replaces a queued one but keeps its deadline, so saves are never starved.
+            deadline = self.pending[key][2] if key in self.pending else time.monotonic() + self.debounce
+            self.pending[key] = (write, on_saved, deadline, filename, atomic)
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                now = time.monotonic()
+                due = [key for key, job in self.pending.items() if self.stopping or job[2] <= now]
+                if not due:
+                    self.condition.wait(min(job[2] for job in self.pending.values()) - now)
+                    continue
+                jobs = [self.pending.pop(key) for key in due]
+
+            for write, on_saved, deadline, filename, atomic in jobs:
+                try:
+                    with self.perf.measure(f"save {os.path.basename(filename)}"):
+                        if atomic:
+                            self.write_atomic(filename, write)
+                        else:
+                            write(filename)
+                    if on_saved:
+                        on_saved()
+                except Exception as e:
+                    self.errors.put((filename, e))
+
+    @staticmethod
+    def write_atomic(filename, write):
+        temp_filename = filename + ".tmp"
+        write(temp_filename)
+        with open(temp_filename, "rb") as temp_file:
+            os.fsync(temp_file.fileno())
+        os.replace(temp_filename, filename)
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        self.thread.join()
+
+class StateStore:
+    def __init__(self, filename="tracker.db"):
+        self.filename = filename
+        self.lock = threading.Lock()
+        # Reads happen on the Tk thread, writes on the autosave thread; the lock serializes them.
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS weapons ("
+                "position INTEGER PRIMARY KEY, weapon TEXT NOT NULL, "
+                "range_start INTEGER NOT NULL, range_end INTEGER NOT NULL)"
+            )
+            self.connection.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS workbook_cache ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, digest TEXT, payload TEXT)"
+            )
+
+    def load(self):
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT weapon, range_start, range_end FROM weapons ORDER BY position"
+            ).fetchall()
+            state = dict(self.connection.execute("SELECT key, value FROM state"))
+        if not rows and "kills" not in state:
+            return None
+        return rows, int(state.get("kills", 0)), int(state.get("active_weapon_index", 0))
+
+    def save_progress(self, kills, active_weapon_index, ingest=None):
+        values = [("kills", kills), ("active_weapon_index", active_weapon_index)]
+        if ingest is not None:
+            values += [("ingest_identity", ingest[0]), ("ingest_offset", ingest[1])]
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", values)
+
+    def ingest_position(self):
+        with self.lock:
+            state = dict(self.connection.execute(
+                "SELECT key, value FROM state WHERE key IN ('ingest_identity', 'ingest_offset')"
+            ))
+        identity = state.get("ingest_identity")
+        return (int(identity) if identity is not None else None), int(state.get("ingest_offset", 0))
+
+    def replace_catalog(self, rows):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM weapons")
+            self.connection.executemany(
+                "INSERT INTO weapons (position, weapon, range_start, range_end) VALUES (?, ?, ?, ?)",
+                [(position,) + tuple(row) for position, row in enumerate(rows)],
+            )
+
+    def cached_workbook(self, path):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT mtime_ns, size, digest, payload FROM workbook_cache WHERE path = ?", (path,)
+            ).fetchone()
+
+    def cache_workbook(self, path, mtime_ns, size, digest, payload):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO workbook_cache (path, mtime_ns, size, digest, payload) VALUES (?, ?, ?, ?, ?)",
+                (path, mtime_ns, size, digest, payload),
+            )
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class WeaponWorkbookReader:
+    def __init__(self, filename):
+        self.filename = filename
+        self.kills = 0
+        self.active_weapon_index = 0
+        self.errors = []
+
+    def __iter__(self):
+        from openpyxl import load_workbook
+
+        # Read-only mode streams rows from the sheet XML instead of building the whole workbook in memory.
+        workbook = load_workbook(self.filename, read_only=True, data_only=True)
+        try:
+            for row_number, row in enumerate(workbook.active.iter_rows(values_only=True), start=1):
+                if row_number == 1:
+                    continue
+                if row_number == 2:
+                    self.read_progress(row)
+                    continue
+                if not row or not row[0]:
+                    continue
+                try:
+                    yield self.parse_row(row)
+                except (TypeError, ValueError, IndexError) as e:
+                    self.errors.append(f"Row {row_number}: {str(e)}")
+        finally:
+            workbook.close()
+
+    def read_progress(self, row):
+        try:
+            self.kills = int(row[4]) if len(row) > 4 and row[4] is not None else 0
+            self.active_weapon_index = int(row[5]) if len(row) > 5 and row[5] is not None else 0
+        except (TypeError, ValueError) as e:
+            self.errors.append(f"Row 2: {str(e)}")
+
+    @staticmethod
+    def parse_row(row):
+        range_start = int(row[1])
+        range_end = int(row[2])
+        if range_start >= range_end:
+            raise ValueError("Range start must be less than range end.")
+        return str(row[0]), range_start, range_end
+
+    @staticmethod
+    def format_errors(errors, limit=10):
+        lines = errors[:limit]
+        if len(errors) > limit:
+            lines.append(f"...and {len(errors) - limit} more")
+        return "\n".join(lines)
+
+class RangeValidator:
+    @staticmethod
+    def describe(row):
+        return f"{row[0]} ({row[1]}-{row[2]})"
+
+    @staticmethod
+    def check(rows):
+        # Sort once, then sweep left to right tracking the furthest range end seen so far.
+        issues = []
+        seen_names = {}
+        seen_ranges = {}
+        reach = None
+        reach_row = None
+        for row in sorted(rows, key=lambda row: (row[1], row[2])):
+            name, range_start, range_end = row[0], row[1], row[2]
+            if name in seen_names:
+                issues.append(f"Duplicate weapon: {RangeValidator.describe(seen_names[name])} and {RangeValidator.describe(row)}")
+            else:
+                seen_names[name] = row
+            if (range_start, range_end) in seen_ranges:
+                issues.append(f"Duplicate range: {RangeValidator.describe(seen_ranges[range_start, range_end])} and {RangeValidator.describe(row)}")
+            else:
+                seen_ranges[range_start, range_end] = row
+            if range_start >= range_end:
+                issues.append(f"Empty range: {RangeValidator.describe(row)}")
+            elif reach is not None and range_start < reach:
+                issues.append(f"Overlap: {RangeValidator.describe(reach_row)} and {RangeValidator.describe(row)}")
+            elif reach is not None and range_start > reach:
+                issues.append(f"Gap: no weapon for kills {reach}-{range_start} between {RangeValidator.describe(reach_row)} and {RangeValidator.describe(row)}")
+            if reach is None or range_end > reach:
+                reach = range_end
+                reach_row = row
+        return issues
+
+    @staticmethod
+    def resequence(rows):
+        # Keep each tier's width and order, and shift every later tier so it starts where the previous one ends.
+        repaired = []
+        seen = set()
+        for name, range_start, range_end in sorted((tuple(row[:3]) for row in rows), key=lambda row: (row[1], row[2])):
+            if (name, range_start, range_end) in seen:
+                continue
+            seen.add((name, range_start, range_end))
+            width = max(range_end - range_start, 1)
+            if repaired:
+                range_start = repaired[-1][2]
+            repaired.append((name, range_start, range_start + width))
+        return repaired
+
+class WeaponTableView:
+    # Sort rank per status code: active first, then incomplete, then complete.
+    STATUS_RANK = (1, 0, 2)
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.window = tk.Toplevel(tracker.root)
+        self.window.title("All Weapons")
+        self.window.geometry("560x480")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        controls = tk.Frame(self.window)
+        controls.pack(fill=tk.X, pady=5)
+        tk.Label(controls, text="Search:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.apply_filter())
+        search_entry = tk.Entry(controls, textvariable=self.search_var, font=("Arial", 12))
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        search_entry.focus_set()
+        tk.Button(controls, text="Sort by Range", command=lambda: self.set_sort("range")).pack(side=tk.LEFT, padx=5)
+        tk.Button(controls, text="Sort by Status", command=lambda: self.set_sort("status")).pack(side=tk.LEFT, padx=5)
+
+        body = tk.Frame(self.window)
+        body.pack(fill=tk.BOTH, expand=True)
+        self.scrollbar = tk.Scrollbar(body, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.rows_frame = tk.Frame(body)
+        self.rows_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.rows_frame.bind("<Configure>", self.on_resize)
+        self.window.bind("<MouseWheel>", self.on_mousewheel)
+        self.window.bind("<Button-4>", self.on_mousewheel)
+        self.window.bind("<Button-5>", self.on_mousewheel)
+
+        self.row_font = tracker.font_cache.get("Arial", 12)
+        self.row_height = self.row_font.metrics("linespace") + 6
+        # Only enough labels to fill the visible area exist; scrolling relabels them.
+        self.row_labels = []
+        self.top = 0
+        self.sort_key = "range"
+        self.query = None
+        self.matches = []
+        self.names = []
+        self.reload()
+
+    def reload(self):
+        self.names = [name.lower() for name in self.tracker.catalog.names]
+        self.query = None
+        self.apply_filter(reset_top=False)
+
+    def sorted_indices(self):
+        catalog = self.tracker.catalog
+        order = list(catalog.index.order)
+        if self.sort_key == "status":
+            order.sort(key=lambda index: self.STATUS_RANK[catalog.statuses[index]])
+        return order
+
+    def apply_filter(self, reset_top=True):
+        query = self.search_var.get().strip().lower()
+        # Narrowing a query only needs to re-check the rows that already matched.
+        if self.query is not None and query.startswith(self.query):
+            candidates = self.matches
+        else:
+            candidates = self.sorted_indices()
+        self.query = query
+        self.matches = [index for index in candidates if query in self.names[index]] if query else candidates
+        if reset_top:
+            self.top = 0
+        self.render()
+
+    def set_sort(self, sort_key):
+        self.sort_key = sort_key
+        self.query = None
+        self.apply_filter()
+
+    def on_resize(self, event):
+        count = max(1, event.height // self.row_height)
+        while len(self.row_labels) < count:
+            label = tk.Label(self.rows_frame, font=self.row_font, anchor="w")
+            label.place(x=0, y=len(self.row_labels) * self.row_height, relwidth=1, height=self.row_height)
+            self.row_labels.append(label)
+        while len(self.row_labels) > count:
+            self.row_labels.pop().destroy()
+        self.render()
+
+    def render(self):
+        total = len(self.matches)
+        self.top = max(0, min(self.top, total - len(self.row_labels)))
+        for offset, label in enumerate(self.row_labels):
+            position = self.top + offset
+            label.config(text=self.tracker.format_weapon_row(self.matches[position]) if position < total else "")
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + len(self.row_labels)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.top = int(float(amount) * len(self.matches))
+        elif unit == "pages":
+            self.top += int(amount) * max(1, len(self.row_labels) - 1)
+        else:
+            self.top += int(amount)
+        self.render()
+
+    def on_mousewheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.on_scroll("scroll", -3, "units")
+        else:
+            self.on_scroll("scroll", 3, "units")
+
+    def refresh(self, changed=None):
+        if changed is None or len(self.names) != len(self.tracker.catalog):
+            self.reload()
+        elif self.sort_key == "status":
+            self.query = None
+            self.apply_filter(reset_top=False)
+        elif set(self.matches[self.top:self.top + len(self.row_labels)]) & set(changed):
+            self.render()
+
+    def close(self):
+        self.tracker.weapons_table = None
+        self.window.destroy()
+
+class GunathonEngine:
+    def __init__(self, rows=(), kills=0, active_weapon_index=0):
+        self.catalog = WeaponCatalog(rows, kills)
+        self.kills = kills
+        self.active_weapon_index = active_weapon_index
+        self.listeners = []
+        self.history = EditHistory()
+        self.update_active_weapon()
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self.listeners.remove(listener)
+
+    def notify(self, event, changes=None):
+        for listener in list(self.listeners):
+            listener(event, changes)
+
+    def load(self, rows, kills=0, active_weapon_index=0):
+        self.catalog.replace(rows, kills)
+        self.kills = kills
+        self.active_weapon_index = active_weapon_index
+        self.history.clear()
+        self.update_active_weapon()
+        self.notify("catalog")
+
+    def add_weapon(self, name, range_start, range_end, index=None, shift=0):
+        if shift:
+            # Make room by moving every tier that starts at or after the new one.
+            self.catalog.shift(range_start, shift)
+        index = self.catalog.insert(len(self.catalog) if index is None else index, name, range_start, range_end)
+        self.history.record("weapon", index, name, range_start, range_end, shift)
+        self.update_active_weapon()
+        self.notify("catalog")
+        return index
+
+    def merge_rows(self, base, rows):
+        changed = self.catalog.merge_rows(base, rows)
+        if changed:
+            # Recorded weapon positions no longer match the catalog.
+            self.history.clear()
+            self.update_active_weapon()
+            self.notify("catalog")
+        return changed
+
+    def remove_weapon(self, index, shift=0):
+        range_start = self.catalog.starts[index]
+        self.catalog.remove(index)
+        if shift:
+            self.catalog.shift(range_start, -shift)
+        self.update_active_weapon()
+        self.notify("catalog")
+
+    def adjust_kills(self, amount):
+        return self.set_kills(self.kills + amount)
+
+    def set_kills(self, kills):
+        if kills != self.kills:
+            self.history.record("kills", self.kills, kills)
+        changes = self.catalog.set_kills(kills)
+        self.kills = kills
+        if changes.activated:
+            self.active_weapon_index = changes.activated[-1]
+        self.notify("kills", changes)
+        return changes
+
+    def restart(self):
+        return self.set_kills(0)
+
+    def undo(self):
+        if not self.history.undo_stack:
+            return None
+        entry = self.history.undo_stack.pop()
+        self.apply_history(entry, forward=False)
+        self.history.redo_stack.append(entry)
+        return entry
+
+    def redo(self):
+        if not self.history.redo_stack:
+            return None
+        entry = self.history.redo_stack.pop()
+        self.apply_history(entry, forward=True)
+        self.history.undo_stack.append(entry)
+        return entry
+
+    def apply_history(self, entry, forward):
+        self.history.recording = False
+        try:
+            if entry[0] == "kills":
+                self.set_kills(entry[2] if forward else entry[1])
+            elif forward:
+                kind, index, name, range_start, range_end, shift = entry
+                self.add_weapon(name, range_start, range_end, index, shift)
+            else:
+                self.remove_weapon(entry[1], entry[5])
+        finally:
+            self.history.recording = True
+
+    def update_active_weapon(self):
+        index = self.catalog.active_index()
+        if index is not None:
+            self.active_weapon_index = index
+
+    def active_weapon(self):
+        index = self.catalog.active_index()
+        return self.catalog[index] if index is not None else None
+
+    def snapshot(self):
+        rows = tuple((weapon.weapon, weapon.range_start, weapon.range_end, weapon.status) for weapon in self.catalog)
+        return rows, self.kills, self.active_weapon_index
+
+    @staticmethod
+    def read_workbook(filename):
+        reader = WeaponWorkbookReader(filename)
+        rows = list(reader)
+        return rows, reader.kills, reader.active_weapon_index, reader.errors
+
+    @staticmethod
+    def write_workbook(filename, snapshot):
+        from openpyxl import Workbook
+
+        rows, kills, active_weapon_index = snapshot
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Weapon", "Range Start", "Range End", "Status", "Kills", "Active Weapon Index"])
+        sheet.append([None, None, None, None, kills, active_weapon_index])
+
+        for row in rows:
+            sheet.append(list(row))
+
+        workbook.save(filename)
+
+class CanvasOverlayRenderer:
+    LINES = ("kills", "weapon", "custom")
+    PADDING_X = 10
+    PADDING_Y = 5
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.canvas = tk.Canvas(tracker.overlay, bg="black", highlightthickness=0, bd=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.compact = False
+        self.backgrounds = {line: self.canvas.create_rectangle(0, 0, 0, 0, width=0, state=tk.HIDDEN) for line in self.LINES}
+        self.texts = {line: self.canvas.create_text(0, 0, anchor="n", state=tk.HIDDEN) for line in self.LINES}
+        # Last options sent per canvas item, plus font metrics cached per font settings.
+        self.rendered = {}
+        self.linespaces = {}
+        self.widths = {}
+
+    def configure_item(self, item, **options):
+        rendered = self.rendered.setdefault(item, {})
+        changed = {name: value for name, value in options.items() if rendered.get(name) != value}
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            rendered.update(changed)
+
+    def move_item(self, item, *coords):
+        rendered = self.rendered.setdefault(item, {})
+        if rendered.get("coords") != coords:
+            self.canvas.coords(item, *coords)
+            rendered["coords"] = coords
+
+    def measure(self, font, font_key, text):
+        key = (font_key, text)
+        width = self.widths.get(key)
+        if width is None:
+            if len(self.widths) >= 1024:
+                self.widths.clear()
+            width = font.measure(text)
+            self.widths[key] = width
+        return width
+
+    def render(self, texts, font, fg, bg):
+        font_key = self.tracker.font_cache.shared_key
+        linespace = self.linespaces.get(font_key)
+        if linespace is None:
+            linespace = font.metrics("linespace")
+            self.linespaces[font_key] = linespace
+
+        visible = [line for line in self.LINES if texts[line] and not (self.compact and line != "custom")]
+        width = max([self.measure(font, font_key, texts[line]) for line in visible] or [0]) + 2 * self.PADDING_X
+        row_height = linespace + 2 * self.PADDING_Y
+        height = max(row_height * len(visible), 1)
+
+        for line in self.LINES:
+            if line not in visible:
+                self.configure_item(self.texts[line], state=tk.HIDDEN)
+                self.configure_item(self.backgrounds[line], state=tk.HIDDEN)
+                continue
+            top = visible.index(line) * row_height
+            text_width = self.measure(font, font_key, texts[line])
+            self.move_item(self.texts[line], width // 2, top + self.PADDING_Y)
+            self.configure_item(self.texts[line], text=texts[line], font=font, fill=fg, state=tk.NORMAL)
+            left = (width - text_width) // 2
+            self.move_item(self.backgrounds[line], left, top + self.PADDING_Y, left + text_width, top + self.PADDING_Y + linespace)
+            self.configure_item(self.backgrounds[line], fill=bg, state=tk.NORMAL if bg != "black" else tk.HIDDEN)
+
+        self.tracker.set_overlay_geometry(f"{width}x{height}")
+
+class OverlayStateBlock:
+    SEQUENCE = struct.Struct("<Q")
+    STATE = struct.Struct("<??i???32s32s64s32s256s256s256s")
+    FIELDS = (
+        "visible", "closed", "size", "bold", "italic", "underline",
+        "fg", "bg", "family", "position", "kills", "weapon", "custom",
+    )
+    TEXT_FIELDS = FIELDS[6:]
+
+    def __init__(self, name=None):
+        size = self.SEQUENCE.size + self.STATE.size
+        self.memory = shared_memory.SharedMemory(name=name, create=name is None, size=size if name is None else 0)
+        self.name = self.memory.name
+        self.sequence = 0
+
+    def write(self, state):
+        # Seqlock: the counter is odd while the block is being rewritten, so readers retry.
+        values = [state[field].encode("utf-8") if field in self.TEXT_FIELDS else state[field] for field in self.FIELDS]
+        self.sequence += 1
+        self.SEQUENCE.pack_into(self.memory.buf, 0, self.sequence)
+        self.STATE.pack_into(self.memory.buf, self.SEQUENCE.size, *values)
+        self.sequence += 1
+        self.SEQUENCE.pack_into(self.memory.buf, 0, self.sequence)
+
+    def read(self, last_sequence=None):
+        while True:
+            sequence = self.SEQUENCE.unpack_from(self.memory.buf, 0)[0]
+            if sequence == last_sequence:
+                return sequence, None
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            values = list(self.STATE.unpack_from(self.memory.buf, self.SEQUENCE.size))
+            if self.SEQUENCE.unpack_from(self.memory.buf, 0)[0] == sequence:
+                break
+        state = dict(zip(self.FIELDS, values))
+        for field in self.TEXT_FIELDS:
+            state[field] = state[field].rstrip(b"\0").decode("utf-8", "ignore")
+        return sequence, state
+
+    def close(self):
+        self.memory.close()
+
+    def unlink(self):
+        self.memory.unlink()
+
+class OverlayProcessView:
+    POLL_INTERVAL = 15
+
+    def __init__(self, root, block):
+        self.root = root
+        self.block = block
+        self.sequence = None
+        self.position = None
+        self.visible = True
+        self.overlay = root
+        self.overlay_rendered = {}
+        self.font_cache = FontCache()
+        self.renderer = CanvasOverlayRenderer(self)
+
+    def set_overlay_geometry(self, geometry):
+        if self.overlay_rendered.get("geometry") != geometry:
+            self.overlay.geometry(geometry)
+            self.overlay_rendered["geometry"] = geometry
+
+    def poll(self):
+        parent = multiprocessing.parent_process()
+        if parent is not None and not parent.is_alive():
+            self.root.destroy()
+            return
+        self.sequence, state = self.block.read(self.sequence)
+        if state is not None:
+            if state["closed"]:
+                self.root.destroy()
+                return
+            self.apply(state)
+        self.root.after(self.POLL_INTERVAL, self.poll)
+
+    def apply(self, state):
+        if state["position"] and state["position"] != self.position:
+            self.root.geometry(state["position"])
+            self.position = state["position"]
+        if state["visible"] != self.visible:
+            if state["visible"]:
+                self.root.deiconify()
+            else:
+                self.root.withdraw()
+            self.visible = state["visible"]
+        font = self.font_cache.shared(state["family"], state["size"], state["bold"], state["italic"], state["underline"])
+        texts = {line: state[line] for line in CanvasOverlayRenderer.LINES}
+        self.renderer.render(texts, font, state["fg"], state["bg"])
+
+def run_overlay_process(block_name):
+    block = OverlayStateBlock(block_name)
+    root = tk.Tk()
+    root.title("Overlay - Hunt Showdown Gunathon Tracker")
+    root.geometry("400x150+100+100")
+    root.attributes("-alpha", 0.8)
+    root.configure(bg="black")
+    try:
+        root.attributes("-transparentcolor", "black")
+    except tk.TclError:
+        # Windows-only, as in create_overlay.
+        pass
+    # Closing is driven by the tracker through the state block.
+    root.protocol("WM_DELETE_WINDOW", lambda: None)
+    view = OverlayProcessView(root, block)
+    view.poll()
+    try:
+        root.mainloop()
+    finally:
+        block.close()
+
+class OverlayProcessRenderer:
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.compact = False
+        self.block = OverlayStateBlock()
+        self.state = {
+            "visible": True,
+            "closed": False,
+            "size": tracker.font_size,
+            "bold": False,
+            "italic": False,
+            "underline": False,
+            "fg": tracker.overlay_color,
+            "bg": "black",
+            "family": tracker.font_family,
+            "position": "+100+100",
+            "kills": "",
+            "weapon": "",
+            "custom": "",
+        }
+        self.block.write(self.state)
+        self.process = multiprocessing.Process(target=run_overlay_process, args=(self.block.name,), daemon=True)
+        self.process.start()
+
+    def publish(self, **changes):
+        if any(self.state[name] != value for name, value in changes.items()):
+            self.state.update(changes)
+            self.block.write(self.state)
+
+    def render(self, texts, font, fg, bg):
+        family, size, bold, italic, underline = self.tracker.font_cache.shared_key
+        if self.compact:
+            texts = dict(texts, kills="", weapon="")
+        self.publish(fg=fg, bg=bg, family=family, size=size, bold=bold, italic=italic, underline=underline, **texts)
+
+    # The methods below let the tracker treat the renderer like its overlay Toplevel.
+    def geometry(self, geometry=None):
+        if geometry is None:
+            return self.state["position"]
+        if "+" in geometry:
+            self.publish(position=geometry[geometry.index("+"):])
+
+    def withdraw(self):
+        self.publish(visible=False)
+
+    def deiconify(self):
+        self.publish(visible=True)
+
+    def destroy(self):
+        self.publish(closed=True)
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.block.close()
+        self.block.unlink()
+
+OVERLAY_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Hunt Showdown Gunathon Tracker Overlay</title>
+<style>
+body { margin: 0; background: transparent; text-align: center; }
+div { padding: 5px 0; white-space: pre; }
+span:empty { display: none; }
+</style>
+</head>
+<body>
+<div><span id="kills"></span></div>
+<div><span id="weapon"></span></div>
+<div><span id="custom"></span></div>
+<script>
+const state = {};
+
+function render() {
+  for (const id of ["kills", "weapon", "custom"]) {
+    const span = document.getElementById(id);
+    span.textContent = state[id] || "";
+    span.style.color = state.color;
+    span.style.background = state.highlight || "transparent";
+    span.style.fontFamily = `"${state.family}"`;
+    span.style.fontSize = `${state.size}pt`;
+    span.style.fontWeight = state.bold ? "bold" : "normal";
+    span.style.fontStyle = state.italic ? "italic" : "normal";
+    span.style.textDecoration = state.underline ? "underline" : "none";
+  }
+}
+
+const events = new EventSource("/events");
+events.onmessage = (event) => {
+  Object.assign(state, JSON.parse(event.data));
+  render();
+};
+</script>
+</body>
+</html>
+"""
+
+class OverlayRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/":
+            self.send_body(OVERLAY_PAGE.encode("utf-8"), "text/html; charset=utf-8")
+        elif self.path == "/state":
+            self.send_body(json.dumps(self.server.overlay.snapshot()).encode("utf-8"), "application/json")
+        elif self.path == "/events":
+            self.stream_events()
+        else:
+            self.send_error(404)
+
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        overlay = self.server.overlay
+        client = overlay.connect()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            while True:
+                try:
+                    message = client.get(timeout=overlay.KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    message = b": keepalive\n\n"
+                if message is None:
+                    break
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            overlay.disconnect(client)
+
+    def log_message(self, format, *args):
+        pass
+
+class OverlayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+class OverlayServer:
+    KEEPALIVE_INTERVAL = 15
+    CLIENT_BACKLOG = 64
+
+    def __init__(self, port, host="127.0.0.1"):
+        self.state = {}
+        self.clients = set()
+        self.lock = threading.Lock()
+        self.httpd = OverlayHTTPServer((host, port), OverlayRequestHandler)
+        self.httpd.overlay = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="overlay-server", daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self.thread.start()
+
+    @staticmethod
+    def event(data):
+        return f"data: {json.dumps(data)}\n\n".encode("utf-8")
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.state)
+
+    def connect(self):
+        client = queue.Queue(maxsize=self.CLIENT_BACKLOG)
+        with self.lock:
+            client.put_nowait(self.event(self.state))
+            self.clients.add(client)
+        return client
+
+    def disconnect(self, client):
+        with self.lock:
+            self.clients.discard(client)
+
+    def publish(self, **state):
+        # Called on the Tk thread; only the changed keys go out, and each event is encoded once.
+        with self.lock:
+            changed = {key: value for key, value in state.items() if self.state.get(key) != value}
+            if not changed:
+                return
+            self.state.update(changed)
+            message = self.event(changed)
+            for client in self.clients:
+                try:
+                    client.put_nowait(message)
+                except queue.Full:
+                    self.resync(client)
+
+    def resync(self, client):
+        # A client that has fallen behind gets its backlog replaced by one full snapshot.
+        with contextlib.suppress(queue.Empty):
+            while True:
+                client.get_nowait()
+        client.put_nowait(self.event(self.state))
+
+    def stop(self):
+        with self.lock:
+            for client in self.clients:
+                self.resync(client)
+                with contextlib.suppress(queue.Full):
+                    client.put_nowait(None)
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class PerfMonitorWindow:
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.monitor = tracker.perf
+        self.monitor.enabled = True
+        self.window = tk.Toplevel(tracker.root)
+        self.window.title("Performance Monitor")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.counters_label = tk.Label(self.window, font=("Courier", 11), justify=tk.LEFT, anchor="w")
+        self.counters_label.pack(fill=tk.X, padx=10, pady=5)
+        self.metrics_label = tk.Label(self.window, font=("Courier", 11), justify=tk.LEFT, anchor="w")
+        self.metrics_label.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        buttons = tk.Frame(self.window)
+        buttons.pack(pady=5)
+        tk.Button(buttons, text="Export Trace", command=self.export_trace).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Clear", command=self.monitor.samples.clear).pack(side=tk.LEFT, padx=5)
+
+        self.after_id = None
+        self.refresh()
+
+    def count_widgets(self, widget):
+        return 1 + sum(self.count_widgets(child) for child in widget.winfo_children())
+
+    def refresh(self):
+        fonts = len(tkFont.names(self.tracker.root))
+        widgets = self.count_widgets(self.tracker.root)
+        self.monitor.samples.append((time.time(), "tcl_fonts", fonts))
+        self.monitor.samples.append((time.time(), "widgets", widgets))
+        self.counters_label.config(
+            text=f"Refreshes/sec: {self.monitor.refreshes_per_second()}\nTcl fonts: {fonts}\nWidgets: {widgets}"
+        )
+
+        lines = [f"{'metric':<24}{'count':>7}{'last':>10}{'p50':>10}{'p95':>10}"]
+        for metric, count, last, median, p95 in self.monitor.summary():
+            if metric in ("tcl_fonts", "widgets"):
+                continue
+            lines.append(f"{metric:<24}{count:>7}{last:>10.2f}{median:>10.2f}{p95:>10.2f}")
+        self.metrics_label.config(text="\n".join(lines))
+        self.after_id = self.window.after(500, self.refresh)
+
+    def export_trace(self):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json"), ("All files", "*.*")],
+            title="Export Performance Trace",
+        )
+        if file_path:
+            try:
+                self.monitor.export(file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export trace: {str(e)}")
+
+    def close(self):
+        if self.after_id:
+            self.window.after_cancel(self.after_id)
+        self.monitor.enabled = self.tracker.perf_monitor_enabled
+        self.tracker.perf_window = None
+        self.window.destroy()
 
 class HuntShowdownGunathonTracker:
+    OVERLAY_RENDERERS = ("labels", "canvas", "process")
+
     def __init__(self, root):
         self.root = root
         self.root.title("Hunt Showdown Gunathon Tracker")
-        self.items = []
-        self.current_kills = 0
+        self.engine = GunathonEngine()
         self.overlay_visible = True
         self.overlay_color = "purple"
         self.highlight_color = None
         self.font_style = {"bold": False, "italic": False, "underline": False}
-        self.active_weapon_index = 0
+        self.unsaved_changes = set()
+        # Weapon rows as last read from items.xlsx; hot reloads apply only what changed against them.
+        self.workbook_rows = None
+        self.saved_kills = None
+        self.weapons_table = None
+        # Last value sent to Tk for each overlay widget option, so unchanged options are skipped.
+        self.overlay_rendered = {}
+        self.overlay_text_cache = {}
+        # Placeholder names each overlay template uses, so a line is only re-rendered when one of them changes.
+        self.overlay_template_fields = {}
+        self.font_cache = FontCache()
+        self.font_families = FontFamilyCatalog("font_families.json")
         self.font_family = "Unfair Style 2 Rough"
         self.font_size = 16
         self.compact_mode = False
+        self.max_refresh_rate = 30
+        self.overlay_renderer = "labels"
+        self.overlay_canvas = None
+        self.overlay_server = None
+        self.overlay_server_enabled = False
+        self.overlay_server_port = 8765
         self.overlay_custom_text = {
             "kills": "Kills: {kills}",
             "weapon": "Active Weapon: {weapon}",
@@ -29,11 +1796,40 @@ class HuntShowdownGunathonTracker:
             "increase_1": "<Up>",
             "decrease_1": "<Down>",
             "toggle_overlay": "ctrl+o",
+            "undo": "<Control-Alt-z>",
+            "redo": "<Control-Alt-y>",
         }
+        self.history_limit = 200
+
+        self.hotkey_events = HotkeyEventQueue()
+        self.hotkey_poll_interval = 10
+        self.ingest_source = ""
+        self.ingest = None
+        self.ingest_advance = 0
+
+        self.perf_monitor_enabled = False
+        self.perf = PerfMonitor()
+        self.perf_window = None
+
+        self.autosave = AutosaveWorker(perf=self.perf)
+        self.autosave_interval = 10000
+        self.autosave_pending = False
 
         self.config = configparser.ConfigParser()
+        self.preferences_fingerprint = None
         self.load_preferences()
-        self.load_items_from_excel("items.xlsx")
+        # Preferences as of the last sync with preferences.ini, to tell edits made here from edits made in the file.
+        self.preference_values = self.current_preferences()
+        self.store = StateStore("tracker.db")
+        self.load_state()
+        self.ingest_identity, self.ingest_offset = self.store.ingest_position()
+        self.journal = KillJournal("items.journal")
+        self.journal_sync_pending = False
+        self.replay_journal()
+        self.engine.history.set_limit(self.history_limit)
+        self.engine.history.clear()
+        self.saved_ingest = (self.ingest_identity, self.ingest_offset)
+        self.render_scheduler = RenderScheduler(root, self.update_ui, self.max_refresh_rate)
 
         self.create_menu()
 
@@ -81,16 +1877,37 @@ class HuntShowdownGunathonTracker:
         self.overlay_settings_button.pack(pady=5)
 
         self.create_overlay()
+        if self.overlay_server_enabled:
+            self.start_overlay_server()
         self.setup_keybinds()
+        self.engine.subscribe(self.on_engine_event)
         self.update_ui()
+        self.process_hotkey_events()
+        self.report_autosave_errors()
+        if self.ingest_source:
+            self.start_ingest()
+
+        self.file_watcher = FileWatcher(self.hotkey_events)
+        # Without a workbook base from this session, read one so later edits can be diffed against it.
+        self.file_watcher.watch("items.xlsx", self.read_weapon_workbook, report_existing=self.workbook_rows is None)
+        self.file_watcher.watch("preferences.ini", self.read_preferences_file)
+        self.file_watcher.start()
+        # The family list is one slow Tcl call on machines with many fonts; fetch it once the UI is up.
+        self.root.after(1000, lambda: self.font_families.load(self.root, self.autosave))
 
     def create_menu(self):
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
 
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        edit_menu.add_command(label="Undo", command=self.undo)
+        edit_menu.add_command(label="Redo", command=self.redo)
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+
         weapons_menu = tk.Menu(menubar, tearoff=0)
         weapons_menu.add_command(label="View All Weapons", command=self.view_all_weapons)
         weapons_menu.add_command(label="Add New Weapon", command=self.add_new_weapon)
+        weapons_menu.add_command(label="Validate Ranges", command=self.validate_ranges)
         weapons_menu.add_separator()
         weapons_menu.add_command(label="Export Weapons to Excel", command=self.export_items_to_excel)
         weapons_menu.add_command(label="Import Weapons from Excel", command=self.import_items_from_excel)
@@ -98,39 +1915,99 @@ class HuntShowdownGunathonTracker:
 
         keybinds_menu = tk.Menu(menubar, tearoff=0)
         keybinds_menu.add_command(label="Customize Keybinds", command=self.customize_keybinds)
+        keybinds_menu.add_separator()
+        keybinds_menu.add_command(label="Read Kills from File...", command=self.choose_ingest_source)
+        keybinds_menu.add_command(label="Stop Reading Kills from File", command=lambda: self.set_ingest_source(""))
         menubar.add_cascade(label="Keybinds", menu=keybinds_menu)
 
+        debug_menu = tk.Menu(menubar, tearoff=0)
+        debug_menu.add_command(label="Performance Monitor", command=self.open_perf_monitor)
+        menubar.add_cascade(label="Debug", menu=debug_menu)
+
+    def open_perf_monitor(self):
+        if self.perf_window:
+            self.perf_window.window.lift()
+            return
+        self.perf_window = PerfMonitorWindow(self)
+
+    @property
+    def catalog(self):
+        return self.engine.catalog
+
+    @property
+    def current_kills(self):
+        return self.engine.kills
+
+    @property
+    def active_weapon_index(self):
+        return self.engine.active_weapon_index
+
+    def load_state(self):
+        state = self.store.load()
+        if state is None:
+            # First run: seed the store from the Excel catalog.
+            self.load_items_from_excel("items.xlsx")
+            self.store.replace_catalog(self.catalog.rows())
+            self.store.save_progress(self.current_kills, self.active_weapon_index)
+            return
+
+        self.engine.load(*state)
+        self.unsaved_changes.clear()
+        self.saved_kills = self.current_kills
+
     def load_items_from_excel(self, filename="items.xlsx"):
         if not os.path.exists(filename):
             self.create_default_excel(filename)
         
         try:
-            workbook = load_workbook(filename)
-            sheet = workbook.active
-            
-            if sheet.max_row > 1:
-                kill_cell = sheet.cell(row=2, column=5)
-                self.current_kills = int(kill_cell.value) if kill_cell.value is not None else 0
-                
-                index_cell = sheet.cell(row=2, column=6)
-                self.active_weapon_index = int(index_cell.value) if index_cell.value is not None else 0
-            
-            self.items = []
-            for row in sheet.iter_rows(min_row=3, values_only=True):
-                if row[0]:
-                    self.items.append({
-                        "weapon": row[0],
-                        "range_start": int(row[1]),
-                        "range_end": int(row[2]),
-                        "status": row[3] if len(row) > 3 else "Incomplete"
-                    })
+            rows, kills, active_weapon_index, errors = self.read_weapon_workbook(filename)
+            if errors:
+                messagebox.showwarning("Skipped Rows", f"Some rows in {filename} were skipped:\n{WeaponWorkbookReader.format_errors(errors)}")
+            self.workbook_rows = [tuple(row) for row in rows]
+            rows = self.review_ranges(rows, filename)
+            self.engine.load(rows, kills, active_weapon_index)
+            self.unsaved_changes.clear()
+            self.saved_kills = self.current_kills
                     
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load items: {str(e)}\nCreating new default file.")
+            backup = filename + ".corrupt"
+            messagebox.showerror("Error", f"Failed to load items: {str(e)}\nThe file was moved to {backup} and a new default file was created.")
+            os.replace(filename, backup)
             self.create_default_excel(filename)
             self.load_items_from_excel(filename)
 
+    def read_weapon_workbook(self, filename):
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        digest = None
+        cached = self.store.cached_workbook(path)
+        if cached:
+            mtime_ns, size, cached_digest, payload = cached
+            if size == stat.st_size:
+                if mtime_ns != stat.st_mtime_ns:
+                    digest = self.file_digest(path)
+                if mtime_ns == stat.st_mtime_ns or digest == cached_digest:
+                    if digest:
+                        self.store.cache_workbook(path, stat.st_mtime_ns, size, digest, payload)
+                    rows, kills, active_weapon_index, errors = json.loads(payload)
+                    return [tuple(row) for row in rows], kills, active_weapon_index, errors
+
+        parsed = GunathonEngine.read_workbook(filename)
+        payload = json.dumps(parsed, separators=(",", ":"))
+        self.store.cache_workbook(path, stat.st_mtime_ns, stat.st_size, digest or self.file_digest(path), payload)
+        return parsed
+
+    @staticmethod
+    def file_digest(path):
+        digest = hashlib.sha1()
+        with open(path, "rb") as workbook_file:
+            for chunk in iter(lambda: workbook_file.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     def create_default_excel(self, filename):
+        from openpyxl import Workbook
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Weapons"
@@ -290,17 +2167,18 @@ class HuntShowdownGunathonTracker:
         messagebox.showinfo("New File Created", f"Created new weapons file: {filename}")
 
     def view_all_weapons(self):
-        weapons_window = tk.Toplevel(self.root)
-        weapons_window.title("All Weapons")
-
-        for item in self.items:
-            status = item["status"]
-            weapon_label = tk.Label(
-                weapons_window,
-                text=f"{item['weapon']} (Range: {item['range_start']}-{item['range_end']}) - {status}",
-                font=("Arial", 12),
-            )
-            weapon_label.pack(pady=5)
+        if self.weapons_table:
+            self.weapons_table.window.lift()
+            return
+        self.weapons_table = WeaponTableView(self)
+
+    def format_weapon_row(self, index):
+        weapon = self.catalog[index]
+        return f"{weapon.weapon} (Range: {weapon.range_start}-{weapon.range_end}) - {weapon.status}"
+
+    def update_weapon_rows(self, changed=None):
+        if self.weapons_table:
+            self.weapons_table.refresh(changed)
 
     def add_new_weapon(self):
         add_weapon_window = tk.Toplevel(self.root)
@@ -340,17 +2218,54 @@ class HuntShowdownGunathonTracker:
             messagebox.showerror("Invalid Input", str(e))
             return
 
-        self.items.append({
-            "weapon": name,
-            "range_start": range_start,
-            "range_end": range_end,
-            "status": "Incomplete",
-        })
+        before, after = self.catalog.neighbours(range_start)
+        if before and before[1] > range_start:
+            messagebox.showerror("Invalid Input", f"The range overlaps the tier {before[0]}-{before[1]}; start at {before[1]} or later.")
+            return
+        shift = 0
+        if after and after[0] < range_end:
+            shift = range_end - after[0]
+            if not messagebox.askyesno(
+                "Overlapping Range",
+                f"{name} ({range_start}-{range_end}) overlaps the tiers after it.\n\nShift every later tier by {shift} kills to make room?",
+            ):
+                return
+
+        index = self.engine.add_weapon(name, range_start, range_end, self.catalog.insertion_index(range_start), shift)
+        if shift:
+            self.unsaved_changes.update(range(len(self.catalog)))
+        else:
+            self.unsaved_changes.add(index)
+        self.save_catalog()
 
-        self.update_ui()
         window.destroy()
         messagebox.showinfo("Success", "Weapon added successfully!")
 
+    def review_ranges(self, rows, source):
+        issues = RangeValidator.check(rows)
+        if issues and messagebox.askyesno(
+            "Range Problems",
+            f"{source} has {len(issues)} range problem(s):\n{WeaponWorkbookReader.format_errors(issues)}\n\n"
+            "Re-sequence the tiers so each one starts where the previous one ends?",
+        ):
+            return RangeValidator.resequence(rows)
+        return rows
+
+    def validate_ranges(self):
+        rows = self.catalog.rows()
+        if not RangeValidator.check(rows):
+            messagebox.showinfo("Validate Ranges", "No overlaps, gaps or duplicates found.")
+            return
+        self.repair_ranges("The weapons list")
+
+    def repair_ranges(self, source):
+        rows = self.catalog.rows()
+        repaired = self.review_ranges(rows, source)
+        if repaired is not rows:
+            self.engine.load(repaired, self.current_kills, self.active_weapon_index)
+            self.unsaved_changes.update(range(len(self.catalog)))
+            self.save_catalog()
+
     def export_items_to_excel(self):
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
@@ -359,15 +2274,7 @@ class HuntShowdownGunathonTracker:
         )
         if file_path:
             try:
-                workbook = Workbook()
-                sheet = workbook.active
-                sheet.append(["Weapon", "Range Start", "Range End", "Status", "Kills", "Active Weapon Index"])
-                sheet.append([None, None, None, None, self.current_kills, self.active_weapon_index])
-                
-                for item in self.items:
-                    sheet.append([item["weapon"], item["range_start"], item["range_end"], item["status"]])
-                
-                workbook.save(file_path)
+                self.save_items_to_excel(file_path)
                 messagebox.showinfo("Success", "Weapons list exported successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export weapons list: {str(e)}")
@@ -379,25 +2286,17 @@ class HuntShowdownGunathonTracker:
         )
         if file_path:
             try:
-                workbook = load_workbook(file_path)
-                sheet = workbook.active
-                self.items.clear()
-
-                if sheet.max_row > 1:
-                    self.current_kills = int(sheet.cell(row=2, column=5).value or 0)
-                    self.active_weapon_index = int(sheet.cell(row=2, column=6).value or 0)
-
-                for row in sheet.iter_rows(min_row=3, values_only=True):
-                    if row[0]:
-                        self.items.append({
-                            "weapon": row[0],
-                            "range_start": int(row[1]),
-                            "range_end": int(row[2]),
-                            "status": row[3] if len(row) > 3 else "Incomplete"
-                        })
-
-                self.update_ui()
-                messagebox.showinfo("Success", "Weapons list imported successfully!")
+                rows, kills, active_weapon_index, errors = self.read_weapon_workbook(file_path)
+                rows = self.review_ranges(rows, file_path)
+
+                self.engine.load(rows, kills, active_weapon_index)
+                self.unsaved_changes.update(range(len(self.catalog)))
+                self.save_catalog()
+                self.save_state()
+                if errors:
+                    messagebox.showwarning("Skipped Rows", f"Weapons list imported, but some rows were skipped:\n{WeaponWorkbookReader.format_errors(errors)}")
+                else:
+                    messagebox.showinfo("Success", "Weapons list imported successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to import weapons list: {str(e)}")
 
@@ -411,12 +2310,93 @@ class HuntShowdownGunathonTracker:
 
         try:
             keyboard.unhook_all()
-            keyboard.add_hotkey(self.keybinds["increase_1"].strip("<>"), lambda: self.adjust_kills(1))
-            keyboard.add_hotkey(self.keybinds["decrease_1"].strip("<>"), lambda: self.adjust_kills(-1))
-            keyboard.add_hotkey("ctrl+o", self.toggle_overlay)
+            keyboard.add_hotkey(self.keybinds["increase_1"].strip("<>"), lambda: self.hotkey_events.push("kills", 1))
+            keyboard.add_hotkey(self.keybinds["decrease_1"].strip("<>"), lambda: self.hotkey_events.push("kills", -1))
+            keyboard.add_hotkey("ctrl+o", lambda: self.hotkey_events.push("toggle_overlay"))
         except:
             pass
 
+        try:
+            # Global so undo works in-game; the global hook also sees presses in the tracker window,
+            # so the window binding is only the fallback and a press is never applied twice.
+            keyboard.add_hotkey(self.keyboard_hotkey(self.keybinds["undo"]), lambda: self.hotkey_events.push("undo"))
+            keyboard.add_hotkey(self.keyboard_hotkey(self.keybinds["redo"]), lambda: self.hotkey_events.push("redo"))
+        except:
+            self.root.bind(self.keybinds["undo"], lambda event: self.undo())
+            self.root.bind(self.keybinds["redo"], lambda event: self.redo())
+
+    @staticmethod
+    def keyboard_hotkey(sequence):
+        # Tk sequences such as <Control-Alt-z> become keyboard hotkeys such as ctrl+alt+z.
+        modifiers = {"control": "ctrl", "alt": "alt", "shift": "shift"}
+        return "+".join(modifiers.get(part.lower(), part.lower()) for part in sequence.strip("<>").split("-"))
+
+    def process_hotkey_events(self):
+        try:
+            for kind, value, received in self.hotkey_events.drain():
+                try:
+                    self.dispatch_hotkey_event(kind, value, received)
+                except Exception:
+                    # Report the failure and keep going so the rest of the drained batch is not lost.
+                    self.root.report_callback_exception(*sys.exc_info())
+        finally:
+            # A failing handler must not stop the pump that hotkeys, the ingester and the file watcher rely on.
+            self.root.after(self.hotkey_poll_interval, self.process_hotkey_events)
+
+    def dispatch_hotkey_event(self, kind, value, received):
+        if kind == "kills":
+            if value:
+                self.perf.input_received(received)
+                self.adjust_kills(value)
+        elif kind == "ingest":
+            self.apply_ingest(*value, received)
+        elif kind == "ingest_file":
+            self.ingest_file_changed(value)
+        elif kind == "file_changed":
+            self.on_file_changed(*value)
+        elif kind == "toggle_overlay":
+            self.toggle_overlay()
+        elif kind == "undo":
+            self.undo()
+        elif kind == "redo":
+            self.redo()
+
+    def apply_ingest(self, delta, advance, received):
+        # journal_kills writes the kills and the new source offset as one record,
+        # so after a crash an event is never applied twice or skipped.
+        self.ingest_advance = advance
+        if delta:
+            self.perf.input_received(received)
+            self.engine.adjust_kills(delta)
+        if self.ingest_advance:
+            self.journal_kills(0)
+
+    def ingest_file_changed(self, identity):
+        self.ingest_identity = identity
+        self.ingest_offset = 0
+        self.journal.append(KillJournal.INGEST_FILE, 0, identity)
+        self.schedule_autosave()
+
+    def choose_ingest_source(self):
+        filename = filedialog.askopenfilename(title="Read Kill Events From")
+        if filename:
+            self.set_ingest_source(filename)
+
+    def set_ingest_source(self, path):
+        self.stop_ingest()
+        self.ingest_source = path
+        if path:
+            self.start_ingest()
+
+    def start_ingest(self):
+        self.ingest = KillEventTail(self.ingest_source, self.hotkey_events, self.ingest_identity, self.ingest_offset)
+        self.ingest.start()
+
+    def stop_ingest(self):
+        if self.ingest:
+            self.ingest.stop()
+            self.ingest = None
+
     def customize_keybinds(self):
         keybind_window = tk.Toplevel(self.root)
         keybind_window.title("Customize Keybinds")
@@ -436,6 +2416,16 @@ class HuntShowdownGunathonTracker:
         toggle_overlay_entry.insert(0, self.keybinds["toggle_overlay"])
         toggle_overlay_entry.pack(pady=5)
 
+        tk.Label(keybind_window, text="Undo:", font=("Arial", 12)).pack(pady=5)
+        undo_entry = tk.Entry(keybind_window, font=("Arial", 12))
+        undo_entry.insert(0, self.keybinds["undo"])
+        undo_entry.pack(pady=5)
+
+        tk.Label(keybind_window, text="Redo:", font=("Arial", 12)).pack(pady=5)
+        redo_entry = tk.Entry(keybind_window, font=("Arial", 12))
+        redo_entry.insert(0, self.keybinds["redo"])
+        redo_entry.pack(pady=5)
+
         save_button = tk.Button(
             keybind_window,
             text="Save Keybinds",
@@ -444,15 +2434,19 @@ class HuntShowdownGunathonTracker:
                 decrease_1_entry.get(),
                 toggle_overlay_entry.get(),
                 keybind_window,
+                undo_entry.get(),
+                redo_entry.get(),
             ),
         )
         save_button.pack(pady=10)
 
-    def save_keybinds(self, increase_1, decrease_1, toggle_overlay, window):
+    def save_keybinds(self, increase_1, decrease_1, toggle_overlay, window, undo="<Control-Alt-z>", redo="<Control-Alt-y>"):
         try:
             self.root.bind(increase_1, lambda event: None)
             self.root.bind(decrease_1, lambda event: None)
             self.root.bind(toggle_overlay, lambda event: None)
+            self.root.bind(undo, lambda event: None)
+            self.root.bind(redo, lambda event: None)
         except tk.TclError:
             messagebox.showerror("Invalid Keybind", "One or more keybinds are invalid.")
             return
@@ -461,6 +2455,8 @@ class HuntShowdownGunathonTracker:
             "increase_1": increase_1,
             "decrease_1": decrease_1,
             "toggle_overlay": toggle_overlay,
+            "undo": undo,
+            "redo": redo,
         }
 
         self.setup_keybinds()
@@ -469,38 +2465,79 @@ class HuntShowdownGunathonTracker:
 
     def toggle_compact_mode(self):
         self.compact_mode = not self.compact_mode
-        if self.compact_mode:
-            self.overlay.geometry("200x50")
+        if self.overlay_canvas:
+            self.overlay_canvas.compact = self.compact_mode
+            self.update_ui()
+        elif self.compact_mode:
+            self.set_overlay_geometry("200x50")
             self.overlay_kills_label.pack_forget()
-            self.overlay_active_label.pack_forget()
+            self.overlay_weapon_label.pack_forget()
         else:
-            self.overlay.geometry("400x150")
+            self.set_overlay_geometry("400x150")
             self.overlay_kills_label.pack(pady=5)
-            self.overlay_active_label.pack(pady=5)
+            self.overlay_weapon_label.pack(pady=5)
 
     def load_preferences(self):
         if os.path.exists("preferences.ini"):
             self.config.read("preferences.ini")
+            self.preferences_fingerprint = FileWatcher.fingerprint("preferences.ini")
             if "Preferences" in self.config:
-                self.overlay_color = self.config["Preferences"].get("overlay_color", "purple")
-                self.highlight_color = self.config["Preferences"].get("highlight_color", None)
-                self.font_family = self.config["Preferences"].get("font_family", "Unfair Style 2 Rough")
-                self.font_size = int(self.config["Preferences"].get("font_size", 16))
-                self.font_style["bold"] = self.config["Preferences"].getboolean("bold", False)
-                self.font_style["italic"] = self.config["Preferences"].getboolean("italic", False)
-                self.font_style["underline"] = self.config["Preferences"].getboolean("underline", False)
-                self.keybinds = {
-                    "increase_1": self.config["Preferences"].get("increase_1", "<Up>"),
-                    "decrease_1": self.config["Preferences"].get("decrease_1", "<Down>"),
-                    "toggle_overlay": self.config["Preferences"].get("toggle_overlay", "ctrl+o"),
-                }
-                self.compact_mode = self.config["Preferences"].getboolean("compact_mode", False)
-                self.overlay_custom_text["kills"] = self.config["Preferences"].get("kills_text", "Kills: {kills}")
-                self.overlay_custom_text["weapon"] = self.config["Preferences"].get("weapon_text", "Active Weapon: {weapon}")
-                self.overlay_custom_text["custom"] = self.config["Preferences"].get("custom_text", "")
+                self.apply_preferences(self.config["Preferences"])
 
-    def save_preferences(self):
-        self.config["Preferences"] = {
+    def apply_preferences(self, preferences):
+        for name, value in self.parse_preferences(preferences).items():
+            if name in ("font_style", "overlay_custom_text"):
+                getattr(self, name).update(value)
+            else:
+                setattr(self, name, value)
+        self.perf.enabled = self.perf_monitor_enabled
+
+    def parse_preferences(self, preferences):
+        # Everything is parsed and checked before apply_preferences assigns anything,
+        # so a bad value raises ValueError without leaving the tracker half-configured.
+        overlay_renderer = preferences.get("overlay_renderer", "labels")
+        keybinds = {
+            "increase_1": preferences.get("increase_1", "<Up>"),
+            "decrease_1": preferences.get("decrease_1", "<Down>"),
+            "toggle_overlay": preferences.get("toggle_overlay", "ctrl+o"),
+            "undo": preferences.get("undo", "<Control-Alt-z>"),
+            "redo": preferences.get("redo", "<Control-Alt-y>"),
+        }
+        for sequence in keybinds.values():
+            try:
+                # Bound on a private tag so the live bindings are not touched.
+                self.root.bind_class("KeybindProbe", sequence, lambda event: None)
+                self.root.unbind_class("KeybindProbe", sequence)
+            except tk.TclError:
+                raise ValueError(f"Invalid keybind: {sequence}")
+        return {
+            "overlay_color": preferences.get("overlay_color", "purple"),
+            "highlight_color": preferences.get("highlight_color", None),
+            "font_family": preferences.get("font_family", "Unfair Style 2 Rough"),
+            "font_size": int(preferences.get("font_size", 16)),
+            "font_style": {
+                "bold": preferences.getboolean("bold", False),
+                "italic": preferences.getboolean("italic", False),
+                "underline": preferences.getboolean("underline", False),
+            },
+            "keybinds": keybinds,
+            "history_limit": int(preferences.get("history_limit", 200)),
+            "compact_mode": preferences.getboolean("compact_mode", False),
+            "max_refresh_rate": int(preferences.get("max_refresh_rate", 30)),
+            "perf_monitor_enabled": preferences.getboolean("perf_monitor", False),
+            "overlay_renderer": overlay_renderer if overlay_renderer in self.OVERLAY_RENDERERS else "labels",
+            "overlay_server_enabled": preferences.getboolean("overlay_server", False),
+            "ingest_source": preferences.get("ingest_source", ""),
+            "overlay_server_port": int(preferences.get("overlay_server_port", 8765)),
+            "overlay_custom_text": {
+                "kills": preferences.get("kills_text", "Kills: {kills}"),
+                "weapon": preferences.get("weapon_text", "Active Weapon: {weapon}"),
+                "custom": preferences.get("custom_text", ""),
+            },
+        }
+
+    def current_preferences(self):
+        return {
             "overlay_color": self.overlay_color,
             "highlight_color": self.highlight_color if self.highlight_color else "",
             "font_family": self.font_family,
@@ -511,23 +2548,143 @@ class HuntShowdownGunathonTracker:
             "increase_1": self.keybinds["increase_1"],
             "decrease_1": self.keybinds["decrease_1"],
             "toggle_overlay": self.keybinds["toggle_overlay"],
+            "undo": self.keybinds["undo"],
+            "redo": self.keybinds["redo"],
+            "history_limit": str(self.history_limit),
             "compact_mode": str(self.compact_mode),
+            "max_refresh_rate": str(self.max_refresh_rate),
+            "perf_monitor": str(self.perf_monitor_enabled),
+            "overlay_renderer": self.overlay_renderer,
+            "overlay_server": str(self.overlay_server_enabled),
+            "overlay_server_port": str(self.overlay_server_port),
+            "ingest_source": self.ingest_source,
             "kills_text": self.overlay_custom_text["kills"],
             "weapon_text": self.overlay_custom_text["weapon"],
             "custom_text": self.overlay_custom_text["custom"],
         }
-        with open("preferences.ini", "w") as configfile:
-            self.config.write(configfile)
+
+    def save_preferences(self):
+        preferences = self.current_preferences()
+        if FileWatcher.fingerprint("preferences.ini") != self.preferences_fingerprint:
+            # The file was edited since it was last read: keep its changes unless the same key was changed here too.
+            for key, value in self.read_preferences_file("preferences.ini").items():
+                base = self.preference_values.get(key)
+                if key in preferences and value != base and preferences[key] == base:
+                    preferences[key] = value
+        self.config["Preferences"] = preferences
+        self.preference_values = dict(preferences)
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        text = buffer.getvalue()
+
+        def write(path):
+            with open(path, "w") as configfile:
+                configfile.write(text)
+
+        def saved():
+            self.preferences_fingerprint = FileWatcher.fingerprint("preferences.ini")
+
+        self.autosave.submit("preferences.ini", write, saved)
+
+    def on_file_changed(self, path, result):
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Failed to reload {path}: {str(result)}")
+            return
+        try:
+            if path == "items.xlsx":
+                self.reload_catalog(*result)
+            elif path == "preferences.ini":
+                self.reload_preferences(result)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Failed to reload {path}: {str(e)}")
+
+    def reload_catalog(self, rows, kills, active_weapon_index, errors):
+        # Progress stays with tracker.db; only weapon rows are taken from the edited workbook.
+        rows = [tuple(row) for row in rows]
+        base, self.workbook_rows = self.workbook_rows, rows
+        if base is None or rows == base:
+            return
+        if errors:
+            messagebox.showwarning("Skipped Rows", f"Some rows in items.xlsx were skipped:\n{WeaponWorkbookReader.format_errors(errors)}")
+        if self.engine.merge_rows(base, rows):
+            self.unsaved_changes.update(range(len(self.catalog)))
+            self.save_catalog()
+            self.repair_ranges("items.xlsx")
+
+    def reload_preferences(self, preferences):
+        self.preferences_fingerprint = FileWatcher.fingerprint("preferences.ini")
+        changed = {key: value for key, value in preferences.items() if self.preference_values.get(key) != value}
+        if not changed:
+            return
+
+        # Only keys edited in the file are taken from it, so unsaved changes made here survive.
+        candidate = configparser.ConfigParser()
+        candidate["Preferences"] = dict(self.current_preferences(), **changed)
+        self.parse_preferences(candidate["Preferences"])
+
+        renderer, compact_mode, ingest_source = self.overlay_renderer, self.compact_mode, self.ingest_source
+        keybinds = dict(self.keybinds)
+        self.config["Preferences"] = dict(candidate["Preferences"])
+        self.apply_preferences(self.config["Preferences"])
+        current = self.current_preferences()
+        self.preference_values.update((key, current[key]) for key in changed if key in current)
+
+        if changed.keys() & keybinds.keys():
+            for key in keybinds.values():
+                self.root.unbind(key)
+            self.setup_keybinds()
+        if "history_limit" in changed:
+            self.engine.history.set_limit(self.history_limit)
+        if "max_refresh_rate" in changed:
+            self.render_scheduler.max_refresh_rate = self.max_refresh_rate
+        if self.compact_mode != compact_mode:
+            self.compact_mode = compact_mode
+            self.toggle_compact_mode()
+        if self.overlay_renderer != renderer:
+            new_renderer, self.overlay_renderer = self.overlay_renderer, renderer
+            self.set_overlay_renderer(new_renderer)
+        if changed.keys() & {"overlay_server", "overlay_server_port"}:
+            if self.overlay_server:
+                self.overlay_server.stop()
+                self.overlay_server = None
+            if self.overlay_server_enabled:
+                self.start_overlay_server()
+        if self.ingest_source != ingest_source:
+            new_source, self.ingest_source = self.ingest_source, ingest_source
+            self.set_ingest_source(new_source)
+        self.update_ui()
+
+    @staticmethod
+    def read_preferences_file(filename):
+        config = configparser.ConfigParser()
+        config.read(filename)
+        return dict(config["Preferences"]) if "Preferences" in config else {}
 
     def create_overlay(self):
+        if self.overlay_renderer == "process":
+            # The overlay paints from its own process, so a busy main window cannot freeze it.
+            self.overlay = self.overlay_canvas = OverlayProcessRenderer(self)
+            self.overlay_canvas.compact = self.compact_mode
+            return
+
         self.overlay = tk.Toplevel(self.root)
         self.overlay.title("Overlay - Hunt Showdown Gunathon Tracker")
         self.overlay.geometry("400x150+100+100")
         self.overlay.attributes("-alpha", 0.8)
         self.overlay.configure(bg="black")
-        self.overlay.attributes("-transparentcolor", "black")
+        try:
+            self.overlay.attributes("-transparentcolor", "black")
+        except tk.TclError:
+            # -transparentcolor is Windows-only; elsewhere the overlay keeps its black background.
+            pass
         self.overlay.protocol("WM_DELETE_WINDOW", self.on_overlay_close)
 
+        if self.overlay_renderer == "canvas":
+            self.overlay_canvas = CanvasOverlayRenderer(self)
+            self.overlay_canvas.compact = self.compact_mode
+            return
+
+        self.overlay_canvas = None
         self.overlay_kills_label = self.create_overlay_label("", pady=5)
         self.overlay_weapon_label = self.create_overlay_label("", pady=5)
         self.overlay_custom_label = self.create_overlay_label("", pady=5)
@@ -536,7 +2693,7 @@ class HuntShowdownGunathonTracker:
             self.toggle_compact_mode()
 
         self.overlay.update_idletasks()
-        self.overlay.geometry(f"{self.overlay.winfo_width()}x{self.overlay.winfo_height()}")
+        self.set_overlay_geometry(f"{self.overlay.winfo_width()}x{self.overlay.winfo_height()}")
 
     def create_overlay_label(self, text, pady=0):
         label = tk.Label(
@@ -553,11 +2710,11 @@ class HuntShowdownGunathonTracker:
         self.toggle_overlay()
 
     def get_font(self):
-        return tkFont.Font(
-            family=self.font_family,
-            size=self.font_size,
-            weight="bold" if self.font_style["bold"] else "normal",
-            slant="italic" if self.font_style["italic"] else "roman",
+        return self.font_cache.shared(
+            self.font_family,
+            self.font_size,
+            bold=self.font_style["bold"],
+            italic=self.font_style["italic"],
             underline=self.font_style["underline"],
         )
 
@@ -581,18 +2738,59 @@ class HuntShowdownGunathonTracker:
         font_window = tk.Toplevel(self.root)
         font_window.title("Select Font")
 
-        font_families = list(tkFont.families())
-        font_families.sort()
+        font_families = self.font_families.load(self.root, self.autosave)
+        search = {"query": "", "matches": font_families}
 
         tk.Label(font_window, text="Select Font Family:", font=("Arial", 12)).pack(pady=5)
-        font_combobox = ttk.Combobox(font_window, values=font_families, font=("Arial", 12))
-        font_combobox.pack(pady=5)
-        font_combobox.set(self.font_family)
+        search_var = tk.StringVar()
+        search_entry = tk.Entry(font_window, textvariable=search_var, width=30, font=("Arial", 12))
+        search_entry.pack(pady=5)
+        search_entry.focus_set()
+
+        list_frame = tk.Frame(font_window)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        family_list = tk.Listbox(list_frame, height=12, width=40, font=("Arial", 12), exportselection=False)
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=family_list.yview)
+        family_list.config(yscrollcommand=scrollbar.set)
+        family_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        family_list.insert(tk.END, *font_families)
+
+        # One preview font reconfigured per click, like FontCache.shared, so browsing families creates no new Tcl fonts.
+        preview_font = tkFont.Font(**FontCache.font_options((
+            self.font_family,
+            self.font_size,
+            self.font_style["bold"],
+            self.font_style["italic"],
+            self.font_style["underline"],
+        )))
+        preview = tk.Label(font_window, text="Kills: 123", font=preview_font)
+        preview.pack(pady=10)
+        selected = {"family": self.font_family}
+
+        def on_search(*args):
+            query = search_var.get()
+            candidates = search["matches"] if search["query"] and query.casefold().startswith(search["query"].casefold()) else None
+            search["query"] = query
+            search["matches"] = self.font_families.search(query, candidates)
+            family_list.delete(0, tk.END)
+            family_list.insert(tk.END, *search["matches"])
+
+        def on_select(event=None):
+            selection = family_list.curselection()
+            if not selection:
+                return
+            selected["family"] = family_list.get(selection[0])
+            preview_font.configure(family=selected["family"])
+
+        search_var.trace_add("write", on_search)
+        family_list.bind("<<ListboxSelect>>", on_select)
+        family_list.bind("<Double-Button-1>", lambda event: self.apply_font(selected["family"], font_window))
 
         apply_button = tk.Button(
             font_window,
             text="Apply",
-            command=lambda: self.apply_font(font_combobox.get(), font_window),
+            command=lambda: self.apply_font(selected["family"], font_window),
         )
         apply_button.pack(pady=10)
 
@@ -604,49 +2802,138 @@ class HuntShowdownGunathonTracker:
     def adjust_kills_custom(self):
         try:
             amount = int(self.custom_adjust_entry.get())
+            if abs(self.current_kills + amount) > KillJournal.MAX_VALUE:
+                raise ValueError(amount)
             self.adjust_kills(amount)
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid number.")
 
     def restart_gunathon(self):
-        self.current_kills = 0
-        for index, item in enumerate(self.items):
-            if index == 0:
-                item["status"] = "Active"
-            else:
-                item["status"] = "Incomplete"
-        self.update_ui()
+        self.engine.restart()
+
+    def undo(self):
+        self.after_history_step(self.engine.undo())
+
+    def redo(self):
+        self.after_history_step(self.engine.redo())
 
-    def update_ui(self):
+    def after_history_step(self, entry):
+        # Kill steps are journaled through the engine's "kills" event; catalog steps rewrite the stored catalog.
+        if entry and entry[0] == "weapon":
+            self.save_catalog()
+
+    def update_ui(self, changes=None):
+        started = time.perf_counter() if self.perf.enabled else None
         self.kills_label.config(text=f"Kills: {self.current_kills}")
         active_weapon = self.get_active_weapon()
-        self.active_weapon_label.config(text=f"Active Weapon: {active_weapon['weapon']}" if active_weapon else "Active Weapon: None")
+        if changes is None or changes:
+            self.active_weapon_label.config(text=f"Active Weapon: {active_weapon.weapon}" if active_weapon else "Active Weapon: None")
+            self.update_weapon_rows(changes.changed if changes is not None else None)
+
+        font = self.get_font()
+        bg = self.highlight_color if self.highlight_color else "black"
+        values = self.overlay_values(active_weapon)
+        texts = {line: self.render_overlay_text(line, **values) for line in CanvasOverlayRenderer.LINES}
+        if self.overlay_server:
+            self.overlay_server.publish(
+                **texts,
+                color=self.overlay_color,
+                highlight=self.highlight_color,
+                family=self.font_family,
+                size=self.font_size,
+                **self.font_style,
+            )
+        if self.overlay_canvas:
+            with self.perf.measure("canvas_render"):
+                self.overlay_canvas.render(texts, font, self.overlay_color, bg)
+            if started is not None:
+                self.perf.painted(started)
+            return
 
-        self.overlay_kills_label.config(
-            text=self.add_letter_spacing(self.overlay_custom_text["kills"].format(kills=self.current_kills)),
-            font=self.get_font(),
+        self.configure_overlay_label(
+            self.overlay_kills_label,
+            text=texts["kills"],
+            font=font,
             fg=self.overlay_color,
-            bg=self.highlight_color if self.highlight_color else "black",
+            bg=bg,
         )
-        self.overlay_weapon_label.config(
-            text=self.add_letter_spacing(self.overlay_custom_text["weapon"].format(weapon=active_weapon["weapon"] if active_weapon else "None")),
-            font=self.get_font(),
+        self.configure_overlay_label(
+            self.overlay_weapon_label,
+            text=texts["weapon"],
+            font=font,
             fg=self.overlay_color,
-            bg=self.highlight_color if self.highlight_color else "black",
+            bg=bg,
         )
-        self.overlay_custom_label.config(
-            text=self.add_letter_spacing(self.overlay_custom_text["custom"]),
-            font=self.get_font(),
+        self.configure_overlay_label(
+            self.overlay_custom_label,
+            text=texts["custom"],
+            font=font,
             fg=self.overlay_color,
-            bg=self.highlight_color if self.highlight_color else "black",
+            bg=bg,
         )
 
-        self.resize_overlay()
+        with self.perf.measure("resize_overlay"):
+            self.resize_overlay()
+        if started is not None:
+            self.perf.painted(started)
+
+    def overlay_values(self, active_weapon):
+        # Placeholders available to every overlay template.
+        values = self.catalog.progress()
+        values["kills"] = self.current_kills
+        values["weapon"] = active_weapon.weapon if active_weapon else "None"
+        return values
+
+    def configure_overlay_label(self, label, **options):
+        rendered = self.overlay_rendered.setdefault(str(label), {})
+        changed = {name: value for name, value in options.items() if rendered.get(name) != value}
+        if changed:
+            label.config(**changed)
+            rendered.update(changed)
+
+    def render_overlay_text(self, line, **values):
+        template = self.overlay_custom_text[line]
+        fields = self.overlay_template_fields.get(template)
+        if fields is None:
+            try:
+                fields = tuple(sorted(self.template_fields(template)))
+            except ValueError:
+                fields = ()
+            self.overlay_template_fields[template] = fields
+        key = (template, tuple(values.get(name) for name in fields))
+        text = self.overlay_text_cache.get(key)
+        if text is None:
+            if len(self.overlay_text_cache) >= 512:
+                self.overlay_text_cache.clear()
+                self.overlay_template_fields.clear()
+            try:
+                text = template.format(**values)
+            except (AttributeError, KeyError, IndexError, ValueError):
+                # Plain overlay text such as "GG :}" is not a template; show it as typed.
+                text = template
+            text = self.add_letter_spacing(text)
+            self.overlay_text_cache[key] = text
+        return text
+
+    @staticmethod
+    def template_fields(template):
+        fields = set()
+        for _, field_name, format_spec, _ in string.Formatter().parse(template):
+            if field_name is not None:
+                fields.add(field_name.partition(".")[0].partition("[")[0])
+            if format_spec and "{" in format_spec:
+                fields |= HuntShowdownGunathonTracker.template_fields(format_spec)
+        return fields
+
+    def set_overlay_geometry(self, geometry):
+        if self.overlay_rendered.get("geometry") != geometry:
+            self.overlay.geometry(geometry)
+            self.overlay_rendered["geometry"] = geometry
 
     def resize_overlay(self):
         width = int(self.font_size * 20)
         height = int(self.font_size * 10)
-        self.overlay.geometry(f"{width}x{height}")
+        self.set_overlay_geometry(f"{width}x{height}")
 
     def add_letter_spacing(self, text, spacing=1):
         return " ".join(text)
@@ -661,29 +2948,101 @@ class HuntShowdownGunathonTracker:
         self.overlay_visible = not self.overlay_visible
 
     def adjust_kills(self, amount):
-        self.current_kills += amount
-        self.update_active_weapon()
-        self.update_ui()
+        self.perf.input_received()
+        self.engine.adjust_kills(amount)
+
+    def on_engine_event(self, event, changes):
+        if event == "kills":
+            self.perf.state_updated()
+            self.apply_progression(changes)
+            self.journal_kills(changes.new_kills - changes.old_kills)
+            self.render_scheduler.request(changes)
+        elif event == "catalog":
+            self.update_ui()
 
-    def update_active_weapon(self):
-        for item in self.items:
-            if self.current_kills < item["range_start"]:
-                item["status"] = "Incomplete"
-            elif self.current_kills >= item["range_end"]:
-                item["status"] = "Complete"
-            else:
-                item["status"] = "Active"
-                self.active_weapon_index = self.items.index(item)
+    def apply_progression(self, changes):
+        if changes.activated:
+            self.journal.append(KillJournal.ACTIVE_WEAPON, 0, self.active_weapon_index)
+        self.unsaved_changes |= changes.changed
+        self.schedule_autosave()
+
+    def replay_journal(self):
+        kills = None
+        for kind, delta, value in self.journal.replay():
+            if kind == KillJournal.KILLS:
+                kills = value
+            elif kind == KillJournal.INGEST:
+                kills = delta
+                self.ingest_offset = value
+            elif kind == KillJournal.INGEST_FILE:
+                self.ingest_identity = value
+                self.ingest_offset = 0
+            elif kind == KillJournal.ACTIVE_WEAPON:
+                self.engine.active_weapon_index = value
+        if kills is not None:
+            self.engine.set_kills(kills)
+
+    def journal_kills(self, delta):
+        if self.ingest_advance:
+            self.ingest_offset += self.ingest_advance
+            self.ingest_advance = 0
+            self.journal.append(KillJournal.INGEST, self.current_kills, self.ingest_offset)
+        else:
+            self.journal.append(KillJournal.KILLS, delta, self.current_kills)
+        if self.journal.should_compact():
+            self.compact_journal()
+        elif not self.journal_sync_pending:
+            self.journal_sync_pending = True
+            self.root.after_idle(self.sync_journal)
+
+    def sync_journal(self):
+        self.journal_sync_pending = False
+        with self.perf.measure("journal_sync"):
+            self.journal.sync()
+
+    def compact_journal(self):
+        self.save_state()
+
+    def is_dirty(self):
+        return (
+            bool(self.unsaved_changes)
+            or self.saved_kills != self.current_kills
+            or self.saved_ingest != (self.ingest_identity, self.ingest_offset)
+        )
+
+    def schedule_autosave(self):
+        if not self.autosave_pending:
+            self.autosave_pending = True
+            self.root.after(self.autosave_interval, self.autosave_now)
+
+    def autosave_now(self):
+        self.autosave_pending = False
+        if self.is_dirty():
+            self.save_state()
+
+    def report_autosave_errors(self):
+        while not self.autosave.errors.empty():
+            filename, error = self.autosave.errors.get()
+            messagebox.showerror("Error", f"Failed to save {filename}: {str(error)}")
+        self.root.after(500, self.report_autosave_errors)
 
     def get_active_weapon(self):
-        for item in self.items:
-            if item["status"] == "Active":
-                return item
-        return None
+        return self.engine.active_weapon()
 
     def on_closing(self):
+        self.file_watcher.stop()
+        self.stop_ingest()
         self.save_preferences()
-        self.save_items_to_excel("items.xlsx")
+        if self.is_dirty():
+            self.save_state()
+        else:
+            self.journal.reset()
+        self.autosave.stop()
+        self.journal.close()
+        self.store.close()
+        if self.overlay_server:
+            self.overlay_server.stop()
+        self.overlay.destroy()
         self.root.destroy()
 
     def open_overlay_settings(self):
@@ -770,6 +3129,58 @@ class HuntShowdownGunathonTracker:
         )
         apply_font_size_button.pack(pady=10)
 
+        tk.Label(overlay_settings_window, text="Overlay Renderer:", font=("Arial", 12)).pack(pady=5)
+        renderer_combobox = ttk.Combobox(overlay_settings_window, values=self.OVERLAY_RENDERERS, state="readonly", font=("Arial", 12))
+        renderer_combobox.pack(pady=5)
+        renderer_combobox.set(self.overlay_renderer)
+        renderer_combobox.bind("<<ComboboxSelected>>", lambda event: self.set_overlay_renderer(renderer_combobox.get()))
+
+        server_var = tk.BooleanVar(value=self.overlay_server_enabled)
+
+        def toggle_server():
+            self.set_overlay_server_enabled(server_var.get())
+            server_var.set(self.overlay_server_enabled)
+
+        tk.Checkbutton(
+            overlay_settings_window,
+            text=f"Serve overlay for browser sources (http://127.0.0.1:{self.overlay_server_port}/)",
+            variable=server_var,
+            command=toggle_server,
+        ).pack(pady=5)
+
+    def set_overlay_server_enabled(self, enabled):
+        self.overlay_server_enabled = enabled
+        if enabled and not self.overlay_server:
+            self.start_overlay_server()
+            self.update_ui()
+        elif not enabled and self.overlay_server:
+            self.overlay_server.stop()
+            self.overlay_server = None
+
+    def start_overlay_server(self):
+        try:
+            self.overlay_server = OverlayServer(self.overlay_server_port)
+        except OSError as e:
+            self.overlay_server_enabled = False
+            messagebox.showerror("Error", f"Could not start the overlay server on port {self.overlay_server_port}: {e}")
+            return
+        self.overlay_server.start()
+
+    def set_overlay_renderer(self, renderer):
+        if renderer == self.overlay_renderer:
+            return
+        self.overlay_renderer = renderer
+        geometry = self.overlay.geometry()
+        position = geometry[geometry.index("+"):] if "+" in geometry else ""
+        self.overlay.destroy()
+        self.overlay_rendered = {}
+        self.create_overlay()
+        if position:
+            self.overlay.geometry(position)
+        if not self.overlay_visible:
+            self.overlay.withdraw()
+        self.update_ui()
+
     def apply_font_size(self):
         try:
             self.font_size = int(self.font_size_entry.get())
@@ -778,27 +3189,122 @@ class HuntShowdownGunathonTracker:
             messagebox.showerror("Invalid Input", "Please enter a valid font size.")
 
     def update_custom_overlay_text(self):
-        self.overlay_custom_text["kills"] = self.kills_text_entry.get()
-        self.overlay_custom_text["weapon"] = self.weapon_text_entry.get()
-        self.overlay_custom_text["custom"] = self.custom_text_entry.get()
+        templates = {
+            "kills": self.kills_text_entry.get(),
+            "weapon": self.weapon_text_entry.get(),
+            "custom": self.custom_text_entry.get(),
+        }
+        values = self.overlay_values(self.get_active_weapon())
+        try:
+            for template in templates.values():
+                template.format(**values)
+        except (AttributeError, KeyError, IndexError, ValueError) as e:
+            messagebox.showerror(
+                "Invalid Template",
+                f"Could not use the template: {e}\nAvailable placeholders: {', '.join('{' + name + '}' for name in values)}",
+            )
+            return
+        self.overlay_custom_text.update(templates)
         self.update_ui()
 
+    def save_catalog(self):
+        rows = self.catalog.rows()
+        self.autosave.submit(
+            self.store.filename,
+            lambda path: self.store.replace_catalog(rows),
+            atomic=False,
+            key="catalog",
+        )
+
+    def save_state(self):
+        kills, active_weapon_index = self.current_kills, self.active_weapon_index
+        ingest = (self.ingest_identity, self.ingest_offset)
+        generation = self.journal.rotate()
+        self.unsaved_changes.clear()
+        self.saved_kills = kills
+        self.saved_ingest = ingest
+        self.autosave.submit(
+            self.store.filename,
+            lambda path: self.store.save_progress(kills, active_weapon_index, ingest),
+            lambda: self.journal.discard_segments(generation),
+            atomic=False,
+            key="progress",
+        )
+
     def save_items_to_excel(self, filename):
+        snapshot = self.engine.snapshot()
+        AutosaveWorker.write_atomic(filename, lambda path: GunathonEngine.write_workbook(path, snapshot))
+
+def read_kill_deltas(stream):
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.lower() == "restart":
+            yield line_number, None
+            continue
         try:
-            workbook = Workbook()
-            sheet = workbook.active
-            sheet.append(["Weapon", "Range Start", "Range End", "Status", "Kills", "Active Weapon Index"])
-            sheet.append([None, None, None, None, self.current_kills, self.active_weapon_index])
-            
-            for item in self.items:
-                sheet.append([item["weapon"], item["range_start"], item["range_end"], item["status"]])
-            
-            workbook.save(filename)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save items: {str(e)}")
+            yield line_number, int(line)
+        except ValueError:
+            print(f"Line {line_number}: not a kill delta: {line}", file=sys.stderr)
+
+def run_replay(args):
+    if args.workbook:
+        rows, kills, active_weapon_index, errors = GunathonEngine.read_workbook(args.workbook)
+        for error in errors:
+            print(error, file=sys.stderr)
+        engine = GunathonEngine(rows, kills, active_weapon_index)
+    elif os.path.exists(args.db):
+        store = StateStore(args.db)
+        state = store.load()
+        store.close()
+        engine = GunathonEngine(*state) if state else GunathonEngine()
+    else:
+        print(f"No state found: {args.db} does not exist and no --workbook was given.", file=sys.stderr)
+        return 1
+
+    stream = sys.stdin if args.replay == "-" else open(args.replay)
+    applied = 0
+    started = time.perf_counter()
+    try:
+        for line_number, delta in read_kill_deltas(stream):
+            if delta is None:
+                engine.restart()
+            else:
+                engine.adjust_kills(delta)
+            applied += 1
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    elapsed = time.perf_counter() - started
+
+    active_weapon = engine.active_weapon()
+    print(f"Kills: {engine.kills}")
+    print(f"Active Weapon: {active_weapon.weapon if active_weapon else 'None'}")
+    print(f"Completed: {engine.catalog.statuses.count(WeaponCatalog.COMPLETE)}/{len(engine.catalog)}")
+    rate = applied / elapsed if elapsed > 0 else float("inf")
+    print(f"Applied {applied} deltas in {elapsed:.3f}s ({rate:.0f}/s)", file=sys.stderr)
+
+    if args.export:
+        GunathonEngine.write_workbook(args.export, engine.snapshot())
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hunt Showdown Gunathon Tracker")
+    parser.add_argument("--replay", metavar="FILE", help="apply kill deltas (one per line, or '-' for stdin) without the GUI and print the result")
+    parser.add_argument("--workbook", metavar="XLSX", help="with --replay, load the catalog from an Excel workbook instead of the state store")
+    parser.add_argument("--db", default="tracker.db", help="state store to read with --replay (default: tracker.db)")
+    parser.add_argument("--export", metavar="XLSX", help="with --replay, write the resulting state to an Excel workbook")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        return run_replay(args)
 
-if __name__ == "__main__":
     root = tk.Tk()
     app = HuntShowdownGunathonTracker(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,226 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from item_tracker import GunathonEngine, KillJournal, RangeValidator, WeaponCatalog, WeaponRangeIndex
+
+# Nagant starts far below zero like the default workbook; Springfield leaves a gap at 10-12.
+ROWS = (("Nagant", -999, 5), ("Winfield", 5, 10), ("Springfield", 12, 20))
+
+def build_index(rows=ROWS):
+    return WeaponRangeIndex([row[1] for row in rows], [row[2] for row in rows])
+
+class WeaponRangeIndexTest(unittest.TestCase):
+    def test_diff_completes_and_activates_crossed_tiers(self):
+        delta = build_index().diff(0, 6)
+        self.assertEqual(delta.completed, [0])
+        self.assertEqual(delta.activated, [1])
+        self.assertEqual(delta.reverted, [])
+
+    def test_diff_into_gap_activates_nothing(self):
+        delta = build_index().diff(6, 11)
+        self.assertEqual(delta.completed, [1])
+        self.assertEqual(delta.activated, [])
+
+    def test_diff_backwards_reverts(self):
+        delta = build_index().diff(13, 4)
+        self.assertEqual(sorted(delta.reverted), [1, 2])
+        self.assertEqual(delta.activated, [0])
+
+    def test_diff_without_change_is_empty(self):
+        self.assertFalse(build_index().diff(3, 3))
+
+    def test_progress_in_tier(self):
+        progress = build_index().progress(7)
+        self.assertEqual(progress["remaining"], 3)
+        self.assertEqual(progress["tiers_left"], 2)
+        self.assertEqual(progress["next_index"], 2)
+        self.assertEqual(progress["to_finish"], 13)
+        # Spans counted from zero kills: 5 + 5 + 8 = 18, with 7 done.
+        self.assertEqual(progress["percent"], round(100.0 * 7 / 18, 1))
+
+    def test_progress_in_gap(self):
+        progress = build_index().progress(11)
+        self.assertEqual(progress["remaining"], 0)
+        self.assertEqual(progress["tiers_left"], 1)
+        self.assertEqual(progress["next_index"], 2)
+        self.assertEqual(progress["percent"], round(100.0 * 10 / 18, 1))
+
+    def test_progress_below_first_tier(self):
+        progress = build_index().progress(-1000)
+        self.assertEqual(progress["remaining"], 0)
+        self.assertEqual(progress["tiers_left"], 3)
+        self.assertEqual(progress["next_index"], 0)
+        self.assertEqual(progress["percent"], 0.0)
+
+    def test_progress_after_last_tier(self):
+        progress = build_index().progress(25)
+        self.assertEqual(progress["tiers_left"], 0)
+        self.assertEqual(progress["next_index"], None)
+        self.assertEqual(progress["percent"], 100.0)
+        self.assertEqual(progress["to_finish"], 0)
+
+class KillJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "items.journal")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open_journal(self):
+        journal = KillJournal(self.filename)
+        records = journal.replay()
+        return journal, records
+
+    def test_replay_returns_appended_records(self):
+        journal, records = self.open_journal()
+        self.assertEqual(records, [])
+        journal.append(KillJournal.KILLS, 1, 1)
+        journal.append(KillJournal.INGEST, 2 ** 40, 2 ** 50)
+        journal.close()
+        journal, records = self.open_journal()
+        self.assertEqual(records, [(KillJournal.KILLS, 1, 1), (KillJournal.INGEST, 2 ** 40, 2 ** 50)])
+        journal.close()
+
+    def test_torn_record_is_truncated(self):
+        journal, _ = self.open_journal()
+        journal.append(KillJournal.KILLS, 1, 1)
+        journal.append(KillJournal.KILLS, 1, 2)
+        journal.close()
+        with open(self.filename, "r+b") as journal_file:
+            journal_file.truncate(KillJournal.RECORD_SIZE + 5)
+        journal, records = self.open_journal()
+        self.assertEqual(records, [(KillJournal.KILLS, 1, 1)])
+        self.assertEqual(os.path.getsize(self.filename), KillJournal.RECORD_SIZE)
+        journal.append(KillJournal.KILLS, 1, 3)
+        journal.close()
+        self.assertEqual(self.open_journal()[1], [(KillJournal.KILLS, 1, 1), (KillJournal.KILLS, 1, 3)])
+
+    def test_corrupt_record_stops_replay(self):
+        journal, _ = self.open_journal()
+        journal.append(KillJournal.KILLS, 1, 1)
+        journal.append(KillJournal.KILLS, 1, 2)
+        journal.close()
+        with open(self.filename, "r+b") as journal_file:
+            journal_file.seek(KillJournal.RECORD_SIZE + 8)
+            journal_file.write(b"\xff")
+        journal, records = self.open_journal()
+        self.assertEqual(records, [(KillJournal.KILLS, 1, 1)])
+        journal.close()
+
+    def test_rotated_segments_replay_until_discarded(self):
+        journal, _ = self.open_journal()
+        journal.append(KillJournal.KILLS, 1, 1)
+        generation = journal.rotate()
+        journal.append(KillJournal.KILLS, 1, 2)
+        journal.close()
+        journal, records = self.open_journal()
+        self.assertEqual(records, [(KillJournal.KILLS, 1, 1), (KillJournal.KILLS, 1, 2)])
+        journal.discard_segments(generation)
+        journal.close()
+        self.assertEqual(self.open_journal()[1], [(KillJournal.KILLS, 1, 2)])
+
+class RangeValidatorTest(unittest.TestCase):
+    def test_clean_ranges_have_no_issues(self):
+        self.assertEqual(RangeValidator.check([("A", 0, 5), ("B", 5, 10)]), [])
+
+    def test_reports_each_kind_of_problem(self):
+        issues = RangeValidator.check([
+            ("A", 0, 5),
+            ("B", 4, 10),
+            ("C", 12, 15),
+            ("C", 15, 15),
+            ("D", 12, 15),
+        ])
+        kinds = {issue.split(":")[0] for issue in issues}
+        self.assertEqual(kinds, {"Duplicate range", "Duplicate weapon", "Empty range", "Gap", "Overlap"})
+
+    def test_resequence_keeps_widths_and_order(self):
+        repaired = RangeValidator.resequence([("B", 4, 10), ("A", 0, 5), ("C", 12, 15), ("A", 0, 5)])
+        self.assertEqual(repaired, [("A", 0, 5), ("B", 5, 11), ("C", 11, 14)])
+        self.assertEqual(RangeValidator.check(repaired), [])
+
+class MergeRowsTest(unittest.TestCase):
+    def test_only_rows_edited_against_base_are_applied(self):
+        base = [("A", 0, 5), ("B", 5, 10)]
+        catalog = WeaponCatalog(base + [("Added Here", 10, 15)])
+        changed = catalog.merge_rows(base, [("A", 0, 5), ("B", 5, 9), ("New", 20, 25)])
+        self.assertEqual(sorted(changed), ["B", "New"])
+        self.assertEqual(catalog.rows(), (("A", 0, 5), ("B", 5, 9), ("Added Here", 10, 15), ("New", 20, 25)))
+
+    def test_rows_removed_from_file_are_removed(self):
+        base = [("A", 0, 5), ("B", 5, 10)]
+        catalog = WeaponCatalog(base)
+        self.assertEqual(catalog.merge_rows(base, [("A", 0, 5)]), ["B"])
+        self.assertEqual(catalog.rows(), (("A", 0, 5),))
+
+    def test_new_rows_are_inserted_in_range_order(self):
+        base = [("A", 0, 5), ("C", 10, 15)]
+        catalog = WeaponCatalog(base)
+        catalog.merge_rows(base, base + [("B", 5, 10)])
+        self.assertEqual([row[0] for row in catalog.rows()], ["A", "B", "C"])
+
+    def test_duplicate_names_are_told_apart(self):
+        base = [("Knife", 0, 5), ("Knife", 5, 10)]
+        catalog = WeaponCatalog(base)
+        catalog.merge_rows(base, [("Knife", 0, 5), ("Knife", 5, 12)])
+        self.assertEqual(catalog.rows(), (("Knife", 0, 5), ("Knife", 5, 12)))
+        catalog.merge_rows([("Knife", 0, 5), ("Knife", 5, 12)], [("Knife", 0, 5)])
+        self.assertEqual(catalog.rows(), (("Knife", 0, 5),))
+
+    def test_unchanged_file_changes_nothing(self):
+        base = [("A", 0, 5)]
+        catalog = WeaponCatalog([("A", 0, 6)])
+        self.assertEqual(catalog.merge_rows(base, base), [])
+        self.assertEqual(catalog.rows(), (("A", 0, 6),))
+
+class EditHistoryTest(unittest.TestCase):
+    def test_undo_and_redo_kills(self):
+        engine = GunathonEngine(ROWS)
+        engine.adjust_kills(3)
+        engine.adjust_kills(4)
+        engine.undo()
+        self.assertEqual(engine.kills, 3)
+        engine.undo()
+        self.assertEqual(engine.kills, 0)
+        self.assertIsNone(engine.undo())
+        engine.redo()
+        self.assertEqual(engine.kills, 3)
+
+    def test_no_op_kill_changes_are_not_recorded(self):
+        engine = GunathonEngine(ROWS)
+        engine.restart()
+        self.assertIsNone(engine.undo())
+
+    def test_undo_and_redo_weapon_added_with_shift(self):
+        engine = GunathonEngine(ROWS)
+        index = engine.add_weapon("Mosin", 5, 7, engine.catalog.insertion_index(5), shift=2)
+        shifted = (("Nagant", -999, 5), ("Mosin", 5, 7), ("Winfield", 7, 12), ("Springfield", 14, 22))
+        self.assertEqual(index, 1)
+        self.assertEqual(engine.catalog.rows(), shifted)
+        engine.undo()
+        self.assertEqual(engine.catalog.rows(), ROWS)
+        engine.redo()
+        self.assertEqual(engine.catalog.rows(), shifted)
+
+    def test_new_edit_clears_redo(self):
+        engine = GunathonEngine(ROWS)
+        engine.adjust_kills(1)
+        engine.undo()
+        engine.adjust_kills(2)
+        self.assertIsNone(engine.redo())
+
+    def test_limit_drops_oldest_entries(self):
+        engine = GunathonEngine(ROWS)
+        engine.history.set_limit(2)
+        for _ in range(3):
+            engine.adjust_kills(1)
+        engine.undo()
+        engine.undo()
+        self.assertIsNone(engine.undo())
+        self.assertEqual(engine.kills, 1)
+
+if __name__ == "__main__":
+    unittest.main()